@@ -1,9 +1,12 @@
 from flask import Flask
+from sqlalchemy.orm import configure_mappers
 
 from config import Config, config_by_name
 from .context_processors import app_context_Processor
 from .extensions import initialize_extensions, init_docs
 from .logging import configure_logging
+from .templating import configure_templates
+from .json_provider import configure_json
 from .seed import seed_database
 from .middleware import register_middleware
 from .blueprints import register_blueprints
@@ -27,6 +30,8 @@ def create_app(config_name=Config.ENV, seed_db=Config.SEED_DB):
     
     app.config.from_object(config_by_name[config_name])
     app.context_processor(app_context_Processor)
+    configure_templates(app)
+    configure_json(app)
     
     # Initialize Flask extensions
     initialize_extensions(app=app)
@@ -40,6 +45,9 @@ def create_app(config_name=Config.ENV, seed_db=Config.SEED_DB):
     # Register blueprints
     register_blueprints(app)
     
+    # Resolve model relationships once at boot instead of on the first query
+    configure_mappers()
+    
     # Initialize OpenAPI docs (Swagger UI and Redoc)
     init_docs(app)
     
@@ -5,6 +5,7 @@ Admin B2B controller.
 from __future__ import annotations
 
 from flask import Response, request
+from sqlalchemy.orm import undefer_group
 import uuid
 
 from app.extensions import db
@@ -29,7 +30,8 @@ class AdminB2BController:
             per_page = request.args.get('per_page', 20, type=int)
             status = request.args.get('status', type=str)
             
-            query = B2BInquiry.query.order_by(B2BInquiry.created_at.desc())
+            # to_dict() includes the text fields, so load them with the rows rather than per inquiry
+            query = B2BInquiry.query.options(undefer_group("b2b_text")).order_by(B2BInquiry.created_at.desc())
             
             if status:
                 query = query.filter_by(status=status)
@@ -84,7 +86,7 @@ class AdminB2BController:
             
             db.session.commit()
             
-            log_event(f"B2B inquiry status updated: {inquiry_id} to {new_status} by admin {current_user.id}")
+            log_event("B2B inquiry status updated", inquiry_id=inquiry_id, new_status=new_status, admin_id=current_user.id)
             
             return success_response(
                 "Inquiry status updated successfully",
@@ -92,7 +94,7 @@ class AdminB2BController:
                 {"inquiry": inquiry.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update B2B inquiry {inquiry_id}", error=e)
+            log_error("Failed to update B2B inquiry", error=e, inquiry_id=inquiry_id)
             db.session.rollback()
             return error_response("Failed to update inquiry", 500)
 
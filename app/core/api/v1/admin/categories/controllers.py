@@ -76,7 +76,7 @@ class AdminCategoryController:
                 return error_response("Category not found", 404)
             return success_response("Category retrieved successfully", 200, {"category": category.to_dict(include_children=True)})
         except Exception as e:
-            log_error(f"Failed to get category {identifier}", error=e)
+            log_error("Failed to get category", error=e, identifier=identifier)
             return error_response("Failed to retrieve category", 500)
 
     @staticmethod
@@ -103,7 +103,7 @@ class AdminCategoryController:
             db.session.add(category)
             db.session.commit()
 
-            log_event(f"Category created: {category.id}")
+            log_event("Category created", category_id=category.id)
             return success_response("Category created successfully", 201, {"category": category.to_dict(include_children=True)})
         except Exception as e:
             log_error("Failed to create category", error=e)
@@ -142,10 +142,10 @@ class AdminCategoryController:
                 category.parent_id = payload.parent_id
 
             db.session.commit()
-            log_event(f"Category updated: {category.id}")
+            log_event("Category updated", category_id=category.id)
             return success_response("Category updated successfully", 200, {"category": category.to_dict(include_children=True)})
         except Exception as e:
-            log_error(f"Failed to update category {identifier}", error=e)
+            log_error("Failed to update category", error=e, identifier=identifier)
             db.session.rollback()
             return error_response("Failed to update category", 500)
 
@@ -171,10 +171,10 @@ class AdminCategoryController:
             db.session.delete(category)
             db.session.commit()
 
-            log_event(f"Category deleted: {identifier}")
+            log_event("Category deleted", identifier=identifier)
             return success_response("Category deleted successfully", 200)
         except Exception as e:
-            log_error(f"Failed to delete category {identifier}", error=e)
+            log_error("Failed to delete category", error=e, identifier=identifier)
             db.session.rollback()
             return error_response("Failed to delete category", 500)
 
@@ -5,6 +5,7 @@ Admin CMS controller.
 from __future__ import annotations
 
 from flask import Response, request
+from sqlalchemy.orm import undefer
 import uuid
 
 from app.extensions import db
@@ -29,7 +30,8 @@ class AdminCmsController:
             per_page = request.args.get('per_page', 20, type=int)
             published = request.args.get('published', type=bool)
             
-            query = CmsPage.query
+            # to_dict() includes the content, so load it with the rows rather than per page
+            query = CmsPage.query.options(undefer(CmsPage.content))
             
             if published is not None:
                 query = query.filter_by(published=published)
@@ -83,7 +85,7 @@ class AdminCmsController:
             db.session.add(page)
             db.session.commit()
             
-            log_event(f"CMS page created: {slug} by admin {current_user.id}")
+            log_event("CMS page created", slug=slug, admin_id=current_user.id)
             
             return success_response(
                 "CMS page created successfully",
@@ -133,7 +135,7 @@ class AdminCmsController:
             
             db.session.commit()
             
-            log_event(f"CMS page updated: {page_id} by admin {current_user.id}")
+            log_event("CMS page updated", page_id=page_id, admin_id=current_user.id)
             
             return success_response(
                 "CMS page updated successfully",
@@ -141,7 +143,7 @@ class AdminCmsController:
                 {"page": page.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update CMS page {page_id}", error=e)
+            log_error("Failed to update CMS page", error=e, page_id=page_id)
             db.session.rollback()
             return error_response("Failed to update CMS page", 500)
 
@@ -165,11 +167,11 @@ class AdminCmsController:
             db.session.delete(page)
             db.session.commit()
             
-            log_event(f"CMS page deleted: {page_id} by admin {current_user.id}")
+            log_event("CMS page deleted", page_id=page_id, admin_id=current_user.id)
             
             return success_response("CMS page deleted successfully", 200)
         except Exception as e:
-            log_error(f"Failed to delete CMS page {page_id}", error=e)
+            log_error("Failed to delete CMS page", error=e, page_id=page_id)
             db.session.rollback()
             return error_response("Failed to delete CMS page", 500)
 
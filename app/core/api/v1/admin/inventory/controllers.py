@@ -80,7 +80,7 @@ class AdminInventoryController:
                 }
             )
             
-            log_event(f"Inventory adjusted: {variant.sku} from {old_quantity} to {inventory.quantity}")
+            log_event("Inventory adjusted", sku=variant.sku, old_quantity=old_quantity, new_quantity=inventory.quantity)
             
             return success_response(
                 "Inventory adjusted successfully",
@@ -178,6 +178,6 @@ class AdminInventoryController:
                 {"inventory": inv_dict}
             )
         except Exception as e:
-            log_error(f"Failed to get inventory for SKU {sku}", error=e)
+            log_error("Failed to get inventory for SKU", error=e, sku=sku)
             return error_response("Failed to retrieve inventory", 500)
 
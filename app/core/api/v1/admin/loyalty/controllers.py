@@ -111,7 +111,7 @@ class AdminLoyaltyController:
                 }
             )
             
-            log_event(f"Loyalty points adjusted: {account_id} by {points_delta} by admin {current_user.id}")
+            log_event("Loyalty points adjusted", account_id=account_id, points_delta=points_delta, admin_id=current_user.id)
             
             return success_response(
                 "Points adjusted successfully",
@@ -119,7 +119,7 @@ class AdminLoyaltyController:
                 {"account": account.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to adjust points for account {account_id}", error=e)
+            log_error("Failed to adjust points for account", error=e, account_id=account_id)
             db.session.rollback()
             return error_response("Failed to adjust points", 500)
 
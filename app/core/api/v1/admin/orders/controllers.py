@@ -5,6 +5,7 @@ Admin order controller.
 from __future__ import annotations
 
 from flask import Response, request
+from sqlalchemy.orm import selectinload, undefer_group
 import uuid
 
 from app.extensions import db
@@ -38,8 +39,8 @@ class AdminOrderController:
             user_id = request.args.get('user_id', type=str)
             search = request.args.get('search', type=str)
             
-            # Build query
-            query = Order.query
+            # Build query; items and their variants are loaded in two batched queries
+            query = Order.query.options(selectinload(Order.items).selectinload(OrderItem.variant), undefer_group("order_detail"))
             
             if status:
                 # Validate status is a valid OrderStatus value
@@ -106,7 +107,10 @@ class AdminOrderController:
             except ValueError:
                 return error_response("Invalid order ID format", 400)
             
-            order = Order.query.get(order_uuid)
+            order = db.session.get(
+                Order, order_uuid,
+                options=[selectinload(Order.items).selectinload(OrderItem.variant), undefer_group("order_detail")],
+            )
             if not order:
                 return error_response("Order not found", 404)
             
@@ -116,7 +120,7 @@ class AdminOrderController:
                 {"order": order.to_dict(include_items=True)}
             )
         except Exception as e:
-            log_error(f"Failed to get order {order_id}", error=e)
+            log_error("Failed to get order", error=e, order_id=order_id)
             return error_response("Failed to retrieve order", 500)
 
     @staticmethod
@@ -171,7 +175,7 @@ class AdminOrderController:
                 }
             )
             
-            log_event(f"Order status updated: {order_id} from {old_status} to {new_status} by admin {current_user.id}")
+            log_event("Order status updated", order_id=order_id, old_status=old_status, new_status=new_status, admin_id=current_user.id)
             
             # Send notification email for status change
             try:
@@ -196,7 +200,7 @@ class AdminOrderController:
                 {"order": order.to_dict(include_items=True)}
             )
         except Exception as e:
-            log_error(f"Failed to update order status {order_id}", error=e)
+            log_error("Failed to update order status", error=e, order_id=order_id)
             db.session.rollback()
             return error_response("Failed to update order status", 500)
 
@@ -241,7 +245,7 @@ class AdminOrderController:
                 }
             )
             
-            log_event(f"Order cancelled: {order_id} by admin {current_user.id}")
+            log_event("Order cancelled", order_id=order_id, admin_id=current_user.id)
             
             return success_response(
                 "Order cancelled successfully",
@@ -249,7 +253,7 @@ class AdminOrderController:
                 {"order": order.to_dict(include_items=True)}
             )
         except Exception as e:
-            log_error(f"Failed to cancel order {order_id}", error=e)
+            log_error("Failed to cancel order", error=e, order_id=order_id)
             db.session.rollback()
             return error_response("Failed to cancel order", 500)
 
@@ -202,7 +202,7 @@ class AdminProductController:
             
             db.session.commit()
             
-            log_event(f"Product created: {product.id} by admin {current_user.id}")
+            log_event("Product created", product_id=product.id, admin_id=current_user.id)
             
             return success_response(
                 "Product created successfully",
@@ -323,7 +323,7 @@ class AdminProductController:
             
             db.session.commit()
             
-            log_event(f"Product updated: {product_id} by admin {current_user.id}")
+            log_event("Product updated", product_id=product_id, admin_id=current_user.id)
             
             return success_response(
                 "Product updated successfully",
@@ -331,7 +331,7 @@ class AdminProductController:
                 {"product": product.to_dict(include_variants=True)}
             )
         except Exception as e:
-            log_error(f"Failed to update product {product_id}", error=e)
+            log_error("Failed to update product", error=e, product_id=product_id)
             db.session.rollback()
             return error_response("Failed to update product", 500)
 
@@ -355,7 +355,7 @@ class AdminProductController:
             launch_status = request.args.get('launch_status', type=str)
             
             # Build query
-            query = Product.query.filter(Product.deleted_at.is_(None))
+            query = Product.query.options(*Product.list_options()).filter(Product.deleted_at.is_(None))
             
             if search:
                 query = query.filter(
@@ -374,7 +374,7 @@ class AdminProductController:
             # Paginate
             pagination = query.paginate(page=page, per_page=per_page, error_out=False)
             
-            products = [p.to_dict(include_variants=True) for p in pagination.items]
+            products = Product.list_to_dicts(pagination.items, include_variants=True)
             
             return success_response(
                 "Products retrieved successfully",
@@ -421,7 +421,7 @@ class AdminProductController:
                 {"product": product.to_dict(include_variants=True)}
             )
         except Exception as e:
-            log_error(f"Failed to get product {product_id}", error=e)
+            log_error("Failed to get product", error=e, product_id=product_id)
             return error_response("Failed to retrieve product", 500)
 
     @staticmethod
@@ -456,11 +456,11 @@ class AdminProductController:
                 
             db.session.commit()
             
-            log_event(f"Product deleted: {product_id} by admin {current_user.id}")
+            log_event("Product deleted", product_id=product_id, admin_id=current_user.id)
             
             return success_response("Product deleted successfully", 200)
         except Exception as e:
-            log_error(f"Failed to delete product {product_id}", error=e)
+            log_error("Failed to delete product", error=e, product_id=product_id)
             db.session.rollback()
             return error_response("Failed to delete product", 500)
 
@@ -555,7 +555,7 @@ class AdminProductController:
             
             db.session.commit()
             
-            log_event(f"Variant created: {variant.id} for product {product_id} by admin {current_user.id}")
+            log_event("Variant created", variant_id=variant.id, product_id=product_id, admin_id=current_user.id)
             
             return success_response(
                 "Variant created successfully",
@@ -563,7 +563,7 @@ class AdminProductController:
                 {"variant": variant.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to create variant for product {product_id}", error=e)
+            log_error("Failed to create variant for product", error=e, product_id=product_id)
             db.session.rollback()
             return error_response("Failed to create variant", 500)
 
@@ -637,7 +637,7 @@ class AdminProductController:
             
             db.session.commit()
             
-            log_event(f"Variant updated: {variant_id} by admin {current_user.id}")
+            log_event("Variant updated", variant_id=variant_id, admin_id=current_user.id)
             
             return success_response(
                 "Variant updated successfully",
@@ -645,7 +645,7 @@ class AdminProductController:
                 {"variant": variant.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update variant {variant_id}", error=e)
+            log_error("Failed to update variant", error=e, variant_id=variant_id)
             db.session.rollback()
             return error_response("Failed to update variant", 500)
 
@@ -676,11 +676,11 @@ class AdminProductController:
             variant.deleted_at = QuasDateTime.aware_utcnow()
             db.session.commit()
             
-            log_event(f"Variant deleted: {variant_id} by admin {current_user.id}")
+            log_event("Variant deleted", variant_id=variant_id, admin_id=current_user.id)
             
             return success_response("Variant deleted successfully", 200)
         except Exception as e:
-            log_error(f"Failed to delete variant {variant_id}", error=e)
+            log_error("Failed to delete variant", error=e, variant_id=variant_id)
             db.session.rollback()
             return error_response("Failed to delete variant", 500)
 
@@ -738,7 +738,7 @@ class AdminProductController:
                     uploaded_images.append(media.to_dict())
                     
                 except Exception as e:
-                    log_error(f"Failed to upload image {file.filename}", error=e)
+                    log_error("Failed to upload image", error=e, file_name=file.filename)
                     errors.append(f"{file.filename}: {str(e)}")
                     # Don't rollback here - continue with other files
                     # Only rollback if commit fails at the end
@@ -758,7 +758,7 @@ class AdminProductController:
                 log_error("Failed to commit product images", error=e)
                 return error_response("Failed to save images", 500)
             
-            log_event(f"Added {len(uploaded_images)} images to product {product_id} by admin {current_user.id}")
+            log_event("Images added to product", product_id=product_id, image_count=len(uploaded_images), admin_id=current_user.id)
             
             response_message = f"Successfully uploaded {len(uploaded_images)} image(s)"
             if errors:
@@ -775,7 +775,7 @@ class AdminProductController:
                 }
             )
         except Exception as e:
-            log_error(f"Failed to add images to product {product_id}", error=e)
+            log_error("Failed to add images to product", error=e, product_id=product_id)
             db.session.rollback()
             return error_response("Failed to upload images", 500)
 
@@ -808,7 +808,7 @@ class AdminProductController:
             if not media:
                 return error_response("Image not found", 404)
             
-            if media not in product.images.all():
+            if media not in product.images:
                 return error_response("Image not associated with this product", 404)
             
             # Remove association using relationship
@@ -816,11 +816,11 @@ class AdminProductController:
             
             db.session.commit()
             
-            log_event(f"Removed image {image_id} from product {product_id} by admin {current_user.id}")
+            log_event("Image removed from product", image_id=image_id, product_id=product_id, admin_id=current_user.id)
             
             return success_response("Image removed successfully", 200)
         except Exception as e:
-            log_error(f"Failed to remove image from product {product_id}", error=e)
+            log_error("Failed to remove image from product", error=e, product_id=product_id)
             db.session.rollback()
             return error_response("Failed to remove image", 500)
 
@@ -884,7 +884,7 @@ class AdminProductController:
                     uploaded_images.append(media.to_dict())
                     
                 except Exception as e:
-                    log_error(f"Failed to upload image {file.filename}", error=e)
+                    log_error("Failed to upload image", error=e, file_name=file.filename)
                     errors.append(f"{file.filename}: {str(e)}")
                     # Don't rollback here - continue with other files
                     continue
@@ -903,7 +903,7 @@ class AdminProductController:
                 log_error("Failed to commit variant images", error=e)
                 return error_response("Failed to save images", 500)
             
-            log_event(f"Added {len(uploaded_images)} images to variant {variant_id} by admin {current_user.id}")
+            log_event("Images added to variant", variant_id=variant_id, image_count=len(uploaded_images), admin_id=current_user.id)
             
             response_message = f"Successfully uploaded {len(uploaded_images)} image(s)"
             if errors:
@@ -921,7 +921,7 @@ class AdminProductController:
                 }
             )
         except Exception as e:
-            log_error(f"Failed to add images to variant {variant_id}", error=e)
+            log_error("Failed to add images to variant", error=e, variant_id=variant_id)
             db.session.rollback()
             return error_response("Failed to upload images", 500)
 
@@ -960,7 +960,7 @@ class AdminProductController:
             if not media:
                 return error_response("Image not found", 404)
             
-            if media not in variant.images.all():
+            if media not in variant.images:
                 return error_response("Image not associated with this variant", 404)
             
             # Remove association using relationship
@@ -968,11 +968,11 @@ class AdminProductController:
             
             db.session.commit()
             
-            log_event(f"Removed image {image_id} from variant {variant_id} by admin {current_user.id}")
+            log_event("Image removed from variant", image_id=image_id, variant_id=variant_id, admin_id=current_user.id)
             
             return success_response("Image removed successfully", 200)
         except Exception as e:
-            log_error(f"Failed to remove image from variant {variant_id}", error=e)
+            log_error("Failed to remove image from variant", error=e, variant_id=variant_id)
             db.session.rollback()
             return error_response("Failed to remove image", 500)
 
@@ -1008,7 +1008,7 @@ class AdminMaterialController:
             db.session.add(material)
             db.session.commit()
             
-            log_event(f"Material created: {material.id} by admin {current_user.id}")
+            log_event("Material created", material_id=material.id, admin_id=current_user.id)
             
             return success_response(
                 "Material created successfully",
@@ -1095,7 +1095,7 @@ class AdminMaterialController:
                 {"material": material.to_dict(include_products=True)}
             )
         except Exception as e:
-            log_error(f"Failed to get material {material_id}", error=e)
+            log_error("Failed to get material", error=e, material_id=material_id)
             return error_response("Failed to retrieve material", 500)
 
     @staticmethod
@@ -1137,7 +1137,7 @@ class AdminMaterialController:
             
             db.session.commit()
             
-            log_event(f"Material updated: {material_id} by admin {current_user.id}")
+            log_event("Material updated", material_id=material_id, admin_id=current_user.id)
             
             return success_response(
                 "Material updated successfully",
@@ -1145,7 +1145,7 @@ class AdminMaterialController:
                 {"material": material.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update material {material_id}", error=e)
+            log_error("Failed to update material", error=e, material_id=material_id)
             db.session.rollback()
             return error_response("Failed to update material", 500)
 
@@ -1184,10 +1184,10 @@ class AdminMaterialController:
             db.session.delete(material)
             db.session.commit()
             
-            log_event(f"Material deleted: {material_id} by admin {current_user.id}")
+            log_event("Material deleted", material_id=material_id, admin_id=current_user.id)
             
             return success_response("Material deleted successfully", 200)
         except Exception as e:
-            log_error(f"Failed to delete material {material_id}", error=e)
+            log_error("Failed to delete material", error=e, material_id=material_id)
             db.session.rollback()
             return error_response("Failed to delete material", 500)
@@ -88,7 +88,7 @@ class AdminRevampController:
             
             db.session.commit()
             
-            log_event(f"Revamp request status updated: {request_id} to {new_status} by admin {current_user.id}")
+            log_event("Revamp request status updated", request_id=request_id, new_status=new_status, admin_id=current_user.id)
             
             return success_response(
                 "Revamp request updated successfully",
@@ -96,7 +96,7 @@ class AdminRevampController:
                 {"request": revamp_request.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update revamp request {request_id}", error=e)
+            log_error("Failed to update revamp request", error=e, request_id=request_id)
             db.session.rollback()
             return error_response("Failed to update revamp request", 500)
 
@@ -87,7 +87,7 @@ class AdminStaffController:
             db.session.add(staff)
             db.session.commit()
             
-            log_event(f"CRM staff created: {staff_code} by admin {current_user.id}")
+            log_event("CRM staff created", staff_code=staff_code, admin_id=current_user.id)
             
             return success_response(
                 "Staff created successfully",
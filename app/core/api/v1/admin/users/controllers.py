@@ -5,16 +5,18 @@ Admin user controller.
 from __future__ import annotations
 
 from flask import Response, request
+import math
 import uuid
 
 from app.extensions import db
 from app.models.user import AppUser, Profile
-from sqlalchemy import or_
+from sqlalchemy import or_, select, func
 from app.models.role import Role, UserRole
 from app.models.audit import AuditLog
 from app.enums.auth import RoleNames
 from quas_utils.api import success_response, error_response
 from app.utils.helpers.user import get_current_user
+from app.utils.helpers.pagination import estimate_table_rows
 from app.logging import log_error, log_event
 
 
@@ -43,7 +45,6 @@ class AdminUserController:
             query = AppUser.query
             
             if search:
-                from sqlalchemy.orm import outerjoin
                 query = query.outerjoin(Profile).filter(
                     or_(
                         AppUser.email.ilike(f'%{search}%'),
@@ -62,8 +63,25 @@ class AdminUserController:
             # Order by date_joined desc
             query = query.order_by(AppUser.date_joined.desc())
             
-            # Paginate
-            pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+            # Paginate; an unfiltered listing doesn't need an exact COUNT(*) over every user
+            filtered = bool(search or role)
+            pagination = query.paginate(page=page, per_page=per_page, error_out=False, count=filtered)
+            
+            total = pagination.total
+            if not filtered:
+                if pagination.items and len(pagination.items) < per_page:
+                    # Last page: the exact total falls out of the offset for free
+                    total = (page - 1) * per_page + len(pagination.items)
+                else:
+                    total = estimate_table_rows(AppUser.__tablename__)
+                    if total is None:
+                        total = db.session.scalar(select(func.count(AppUser.id)))
+                    elif pagination.items:
+                        # The estimate can lag behind recent signups; never report fewer
+                        # users than this page proves exist, plus one when a next page may follow
+                        seen = (page - 1) * per_page + len(pagination.items)
+                        total = max(total, seen + (1 if len(pagination.items) == per_page else 0))
+            pages = math.ceil(total / per_page) if total and per_page else 0
             
             users = [u.to_dict() for u in pagination.items]
             
@@ -75,8 +93,8 @@ class AdminUserController:
                     "pagination": {
                         "page": page,
                         "per_page": per_page,
-                        "total": pagination.total,
-                        "pages": pagination.pages
+                        "total": total,
+                        "pages": pages
                     }
                 }
             )
@@ -120,7 +138,7 @@ class AdminUserController:
                 {"user": user_data}
             )
         except Exception as e:
-            log_error(f"Failed to get user {user_id}", error=e)
+            log_error("Failed to get user", error=e, user_id=user_id)
             return error_response("Failed to retrieve user", 500)
 
     @staticmethod
@@ -181,7 +199,7 @@ class AdminUserController:
                 }
             )
             
-            log_event(f"Role {role_name} assigned to user {user_id} by admin {current_user.id}")
+            log_event("Role assigned", role=role_name, user_id=user_id, admin_id=current_user.id)
             
             return success_response(
                 "Role assigned successfully",
@@ -189,7 +207,7 @@ class AdminUserController:
                 {"user": user.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to assign role to user {user_id}", error=e)
+            log_error("Failed to assign role to user", error=e, user_id=user_id)
             db.session.rollback()
             return error_response("Failed to assign role", 500)
 
@@ -251,7 +269,7 @@ class AdminUserController:
                 }
             )
             
-            log_event(f"Role {role_name} revoked from user {user_id} by admin {current_user.id}")
+            log_event("Role revoked", role=role_name, user_id=user_id, admin_id=current_user.id)
             
             return success_response(
                 "Role revoked successfully",
@@ -259,7 +277,7 @@ class AdminUserController:
                 {"user": user.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to revoke role from user {user_id}", error=e)
+            log_error("Failed to revoke role from user", error=e, user_id=user_id)
             db.session.rollback()
             return error_response("Failed to revoke role", 500)
 
@@ -308,7 +326,7 @@ class AdminUserController:
                 }
             )
             
-            log_event(f"User {user_id} deactivated by admin {current_user.id}")
+            log_event("User deactivated", user_id=user_id, admin_id=current_user.id)
             
             return success_response(
                 "User deactivated successfully",
@@ -316,7 +334,7 @@ class AdminUserController:
                 {"user": user.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to deactivate user {user_id}", error=e)
+            log_error("Failed to deactivate user", error=e, user_id=user_id)
             db.session.rollback()
             return error_response("Failed to deactivate user", 500)
 
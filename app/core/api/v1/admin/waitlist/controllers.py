@@ -103,7 +103,7 @@ class AdminWaitlistController:
             
             db.session.commit()
             
-            log_event(f"Waitlist entry status updated: {entry_id} from {old_status} to {new_status} by admin {current_user.id}")
+            log_event("Waitlist entry status updated", entry_id=entry_id, old_status=old_status, new_status=new_status, admin_id=current_user.id)
             
             return success_response(
                 "Waitlist entry status updated successfully",
@@ -111,7 +111,7 @@ class AdminWaitlistController:
                 {"entry": entry.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update waitlist entry {entry_id}", error=e)
+            log_error("Failed to update waitlist entry", error=e, entry_id=entry_id)
             db.session.rollback()
             return error_response("Failed to update waitlist entry", 500)
 
@@ -136,7 +136,7 @@ class AdminWaitlistController:
             db.session.delete(entry)
             db.session.commit()
             
-            log_event(f"Waitlist entry deleted: {entry_id} ({email}) by admin {current_user.id}")
+            log_event("Waitlist entry deleted", entry_id=entry_id, email=email, admin_id=current_user.id)
             
             return success_response(
                 "Waitlist entry deleted successfully",
@@ -144,7 +144,7 @@ class AdminWaitlistController:
                 {"message": "Entry deleted successfully"}
             )
         except Exception as e:
-            log_error(f"Failed to delete waitlist entry {entry_id}", error=e)
+            log_error("Failed to delete waitlist entry", error=e, entry_id=entry_id)
             db.session.rollback()
             return error_response("Failed to delete waitlist entry", 500)
 
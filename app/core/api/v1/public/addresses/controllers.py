@@ -110,7 +110,7 @@ class AddressController:
                 {"address": address.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to update address {address_id}", error=e)
+            log_error("Failed to update address", error=e, address_id=address_id)
             db.session.rollback()
             return error_response("Failed to update address", 500)
 
@@ -142,7 +142,7 @@ class AddressController:
             
             return success_response("Address deleted successfully", 200)
         except Exception as e:
-            log_error(f"Failed to delete address {address_id}", error=e)
+            log_error("Failed to delete address", error=e, address_id=address_id)
             db.session.rollback()
             return error_response("Failed to delete address", 500)
 
@@ -5,7 +5,6 @@ B2B inquiry controller for public endpoints.
 from __future__ import annotations
 
 from flask import Response, request
-import json
 
 from app.extensions import db
 from app.models.cms import B2BInquiry
@@ -36,14 +35,14 @@ class B2BController:
             inquiry.phone = payload.phone
             inquiry.country = payload.country
             inquiry.expected_volume = payload.expected_volume
-            inquiry.product_categories = json.dumps(payload.product_categories) if payload.product_categories else None
+            inquiry.product_categories = payload.product_categories or None
             inquiry.note = payload.note
             inquiry.status = "new"
             
             db.session.add(inquiry)
             db.session.commit()
             
-            log_event(f"B2B inquiry created: {inquiry.id} from {payload.email}")
+            log_event("B2B inquiry created", inquiry_id=inquiry.id, email=payload.email)
             
             # TODO: Send notification email to sales team
             
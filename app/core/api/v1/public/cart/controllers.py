@@ -46,21 +46,21 @@ def get_or_create_cart(user_id: Optional[uuid.UUID] = None, guest_token: Optiona
     """
     if user_id:
         # For authenticated users, ALWAYS prioritize user cart
-        log_event(f"get_or_create_cart: Authenticated user {user_id}, guest_token provided: {bool(guest_token)}")
+        log_event("get_or_create_cart: authenticated user", user_id=user_id, has_guest_token=bool(guest_token))
         # First, try to find existing user cart
         user_cart = Cart.query.filter_by(user_id=user_id).first()
-        log_event(f"get_or_create_cart: Existing user cart found: {bool(user_cart)}, Cart ID: {user_cart.id if user_cart else None}")
+        log_event("get_or_create_cart: existing user cart lookup", found=bool(user_cart), cart_id=user_cart.id if user_cart else None)
         
         # If guest_token provided, check for guest cart to migrate
         if guest_token and not user_cart:
             guest_cart = Cart.query.filter_by(guest_token=guest_token).first()
             if guest_cart:
                 # Migrate guest cart to user cart
-                log_event(f"get_or_create_cart: Migrating guest cart {guest_cart.id} to user {user_id}")
+                log_event("get_or_create_cart: migrating guest cart", cart_id=guest_cart.id, user_id=user_id)
                 guest_cart.user_id = user_id
                 guest_cart.guest_token = None  # Clear guest token after migration
                 db.session.commit()
-                log_event(f"Migrated guest cart {guest_cart.id} to user {user_id}")
+                log_event("Migrated guest cart", cart_id=guest_cart.id, user_id=user_id)
                 return guest_cart
         
         # If user cart exists and guest cart exists, merge items
@@ -69,12 +69,14 @@ def get_or_create_cart(user_id: Optional[uuid.UUID] = None, guest_token: Optiona
             if guest_cart and guest_cart.id != user_cart.id:
                 # Merge guest cart items into user cart
                 guest_items = list(guest_cart.items)  # Get copy of items before modifying
+                # One query for the user's items instead of one lookup per guest item
+                user_items_by_variant = {
+                    item.variant_id: item
+                    for item in CartItem.query.filter_by(cart_id=user_cart.id)
+                }
                 for guest_item in guest_items:
                     # Check if variant already exists in user cart
-                    existing_item = CartItem.query.filter_by(
-                        cart_id=user_cart.id,
-                        variant_id=guest_item.variant_id
-                    ).first()
+                    existing_item = user_items_by_variant.get(guest_item.variant_id)
                     
                     if existing_item:
                         # Update quantity
@@ -84,11 +86,12 @@ def get_or_create_cart(user_id: Optional[uuid.UUID] = None, guest_token: Optiona
                     else:
                         # Move item to user cart
                         guest_item.cart_id = user_cart.id
+                        user_items_by_variant[guest_item.variant_id] = guest_item
                 
                 # Delete guest cart after migration (items already moved or deleted)
                 db.session.delete(guest_cart)
                 db.session.commit()
-                log_event(f"Merged guest cart {guest_cart.id} into user cart {user_cart.id} for user {user_id}")
+                log_event("Merged guest cart into user cart", guest_cart_id=guest_cart.id, cart_id=user_cart.id, user_id=user_id)
                 # Refresh to get updated items
                 db.session.refresh(user_cart)
         
@@ -96,7 +99,7 @@ def get_or_create_cart(user_id: Optional[uuid.UUID] = None, guest_token: Optiona
         # IMPORTANT: For authenticated users, we ALWAYS create a cart with user_id
         # We NEVER create a guest cart for authenticated users, even if guest_token is provided
         if not user_cart:
-            log_event(f"get_or_create_cart: No user cart found, creating new cart for user {user_id}")
+            log_event("get_or_create_cart: No user cart found, creating new cart", user_id=user_id)
             user_cart = Cart()
             user_cart.user_id = user_id
             # Explicitly set guest_token to None for authenticated users
@@ -105,19 +108,19 @@ def get_or_create_cart(user_id: Optional[uuid.UUID] = None, guest_token: Optiona
             db.session.add(user_cart)
             db.session.flush()  # Flush to get the ID
             db.session.commit()
-            log_event(f"Created new cart {user_cart.id} for authenticated user {user_id} - user_id: {user_cart.user_id}, guest_token: {user_cart.guest_token}")
+            log_event("Created new cart for authenticated user", cart_id=user_cart.id, user_id=user_id, cart_user_id=user_cart.user_id, guest_token=user_cart.guest_token)
         
         # CRITICAL: Double-check that the cart is properly associated with the user
         # This prevents any edge cases where a cart might not have the correct user_id
         if user_cart.user_id != user_id:
-            log_error(f"Cart {user_cart.id} has wrong user_id {user_cart.user_id}, expected {user_id}. Fixing...", error=None)
+            log_error("Cart has wrong user_id, fixing", cart_id=user_cart.id, cart_user_id=user_cart.user_id, user_id=user_id)
             user_cart.user_id = user_id
             user_cart.guest_token = None  # Ensure guest_token is cleared
             db.session.commit()
-            log_event(f"Fixed cart {user_cart.id} to be associated with user {user_id}")
+            log_event("Fixed cart user association", cart_id=user_cart.id, user_id=user_id)
         
         # Final verification log
-        log_event(f"get_or_create_cart: Returning cart {user_cart.id} for user {user_id} - cart.user_id: {user_cart.user_id}, cart.guest_token: {user_cart.guest_token}")
+        log_event("get_or_create_cart: returning cart", cart_id=user_cart.id, user_id=user_id, cart_user_id=user_cart.user_id, guest_token=user_cart.guest_token)
         return user_cart
     elif guest_token:
         # Always use the provided guest_token - don't generate a new one
@@ -158,7 +161,7 @@ class CartController:
             # Log authentication status
             auth_token = request.headers.get("Authorization", "")
             has_auth_header = bool(auth_token and auth_token.startswith("Bearer "))
-            log_event(f"Get cart request - Authenticated: {bool(current_user)}, Has Auth Header: {has_auth_header}, User ID: {current_user.id if current_user else None}")
+            log_event("Get cart request", authenticated=bool(current_user), has_auth_header=has_auth_header, user_id=current_user.id if current_user else None)
             
             # Check for cart_id or guest_token in query params (for direct cart lookup)
             cart_id = request.args.get("cart_id")
@@ -175,11 +178,11 @@ class CartController:
                         # Verify ownership - CRITICAL: For authenticated users, cart MUST have matching user_id
                         if current_user:
                             if cart.user_id != current_user.id:
-                                log_error(f"Cart ownership mismatch: Cart {cart.id} has user_id {cart.user_id}, but current user is {current_user.id}", error=None)
+                                log_error("Cart ownership mismatch", cart_id=cart.id, cart_user_id=cart.user_id, user_id=current_user.id)
                                 return error_response("Unauthorized access to cart", 403)
                             # Also verify it's not a guest cart (shouldn't have guest_token for authenticated users)
                             if cart.guest_token and not cart.user_id:
-                                log_error(f"Cart {cart.id} is a guest cart but user is authenticated", error=None)
+                                log_error("Guest cart requested by authenticated user", cart_id=cart.id)
                                 return error_response("Unauthorized access to cart", 403)
                         elif not current_user:
                             # For guests, verify guest_token matches
@@ -200,25 +203,25 @@ class CartController:
                 )
                 # Verify cart is properly associated with user
                 if cart and cart.user_id != current_user.id:
-                    log_error(f"Cart {cart.id} is not associated with user {current_user.id}. Cart user_id: {cart.user_id}", error=None)
+                    log_error("Cart is not associated with user", cart_id=cart.id, user_id=current_user.id, cart_user_id=cart.user_id)
                     # Force create a new cart for the user
                     cart = Cart()
                     cart.user_id = current_user.id
                     cart.guest_token = None
                     db.session.add(cart)
                     db.session.commit()
-                    log_event(f"Created new cart {cart.id} for user {current_user.id} due to mismatch")
+                    log_event("Created new cart due to user mismatch", cart_id=cart.id, user_id=current_user.id)
                 # Log for debugging
                 if cart:
-                    log_event(f"Get cart: User {current_user.id}, Cart {cart.id}, Cart user_id: {cart.user_id}, Cart guest_token: {cart.guest_token}, Items count: {len(cart.items)}")
+                    log_event("Get cart for user", user_id=current_user.id, cart_id=cart.id, cart_user_id=cart.user_id, guest_token=cart.guest_token, item_count=len(cart.items))
                 else:
-                    log_event(f"Get cart: User {current_user.id}, No cart found - will create new one")
+                    log_event("Get cart for user: no cart found, creating one", user_id=current_user.id)
             elif guest_token:
-                log_event(f"Get cart: Guest request, guest_token: {guest_token[:10] if guest_token else None}...")
+                log_event("Get cart for guest", guest_token_prefix=guest_token[:10] if guest_token else None)
                 cart = get_or_create_cart(guest_token=guest_token)
             else:
                 # No user, no token - create new guest cart
-                log_event(f"Get cart: No user, no token - creating new guest cart")
+                log_event("Get cart: no user, no token - creating new guest cart")
                 cart = get_or_create_cart()
                 guest_token = cart.guest_token
             
@@ -268,7 +271,7 @@ class CartController:
             # Log authentication status
             auth_token = request.headers.get("Authorization", "")
             has_auth_header = bool(auth_token and auth_token.startswith("Bearer "))
-            log_event(f"Add item request - Authenticated: {bool(current_user)}, Has Auth Header: {has_auth_header}, User ID: {current_user.id if current_user else None}")
+            log_event("Add item request", authenticated=bool(current_user), has_auth_header=has_auth_header, user_id=current_user.id if current_user else None)
             
             # For authenticated users, we should NOT use guest_token from payload/header
             # Guest token is only used for migration if provided
@@ -277,11 +280,11 @@ class CartController:
             if not current_user:
                 # Only use guest_token for guests
                 guest_token = payload.guest_token or request.headers.get("X-Guest-Token")
-                log_event(f"Guest request - Using guest_token: {bool(guest_token)}")
+                log_event("Add item for guest", has_guest_token=bool(guest_token))
             elif payload.guest_token or request.headers.get("X-Guest-Token"):
                 # For authenticated users, guest_token is only for migration
                 guest_token = payload.guest_token or request.headers.get("X-Guest-Token")
-                log_event(f"Authenticated user with guest_token for migration - User: {current_user.id}, Guest token: {guest_token[:10] if guest_token else None}...")
+                log_event("Authenticated user with guest_token for migration", user_id=current_user.id, guest_token_prefix=guest_token[:10] if guest_token else None)
             
             # Get or create cart
             cart = get_or_create_cart(
@@ -291,9 +294,9 @@ class CartController:
             
             # Log cart details
             if current_user:
-                log_event(f"Add item: User {current_user.id}, Cart {cart.id}, Cart user_id: {cart.user_id}, Cart guest_token: {cart.guest_token}")
+                log_event("Add item for user", user_id=current_user.id, cart_id=cart.id, cart_user_id=cart.user_id, guest_token=cart.guest_token)
             else:
-                log_event(f"Add item: Guest, Cart {cart.id}, Cart user_id: {cart.user_id}, Cart guest_token: {cart.guest_token}")
+                log_event("Add item for guest cart", cart_id=cart.id, cart_user_id=cart.user_id, guest_token=cart.guest_token)
             
             # Validate variant
             try:
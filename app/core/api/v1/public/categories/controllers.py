@@ -68,6 +68,6 @@ class PublicCategoryController:
                 return error_response("Category not found", 404)
             return success_response("Category retrieved successfully", 200, {"category": category.to_dict(include_children=True)})
         except Exception as e:
-            log_error(f"Failed to get category (public) {identifier}", error=e)
+            log_error("Failed to get category (public)", error=e, identifier=identifier)
             return error_response("Failed to retrieve category", 500)
 
@@ -5,6 +5,7 @@ CMS controller for public content endpoints.
 from __future__ import annotations
 
 from flask import Response
+from sqlalchemy.orm import undefer
 
 from app.extensions import db
 from app.models.cms import CmsPage
@@ -26,7 +27,7 @@ class CmsController:
             slug: Page slug
         """
         try:
-            page = CmsPage.query.filter_by(slug=slug, published=True).first()
+            page = CmsPage.query.options(undefer(CmsPage.content)).filter_by(slug=slug, published=True).first()
             
             if not page:
                 return error_response("Page not found", 404)
@@ -37,7 +38,7 @@ class CmsController:
                 {"page": page.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to get CMS page {slug}", error=e)
+            log_error("Failed to get CMS page", error=e, slug=slug)
             return error_response("Failed to retrieve page", 500)
 
 
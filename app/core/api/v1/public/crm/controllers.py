@@ -82,7 +82,7 @@ class CrmController:
             db.session.add(rating)
             db.session.commit()
             
-            log_event(f"CRM rating created: Order {order_uuid}, Staff {order.packed_by_crm_id}, Stars {payload.stars}")
+            log_event("CRM rating created", order_id=order_uuid, staff_id=order.packed_by_crm_id, stars=payload.stars)
             
             return success_response(
                 "Rating submitted successfully",
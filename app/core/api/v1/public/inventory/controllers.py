@@ -49,7 +49,7 @@ class InventoryController:
                 {"inventory": inventory_data}
             )
         except Exception as e:
-            log_error(f"Failed to get inventory for SKU {sku}", error=e)
+            log_error("Failed to get inventory for SKU", error=e, sku=sku)
             return error_response("Failed to retrieve inventory information", 500)
 
 
@@ -4,7 +4,7 @@ Loyalty controller for public loyalty endpoints.
 
 from __future__ import annotations
 
-from flask import Response, request
+from flask import Response, current_app, request, stream_with_context
 from typing import Optional
 
 from app.extensions import db
@@ -142,3 +142,37 @@ class LoyaltyController:
             log_error("Failed to get loyalty ledger", error=e)
             return error_response("Failed to retrieve loyalty ledger", 500)
 
+    @staticmethod
+    def export_ledger() -> Response:
+        """
+        Export the current user's full ledger as newline-delimited JSON.
+        
+        Entries are streamed in batches rather than loaded up front, so the
+        response size doesn't bound memory use.
+        """
+        try:
+            current_user = get_current_user()
+            
+            if not current_user:
+                return error_response("Unauthorized", 401)
+            
+            loyalty_account = LoyaltyAccount.query.filter_by(user_id=current_user.id).first()
+            if not loyalty_account:
+                return Response("", mimetype="application/x-ndjson")
+            
+            account_id = loyalty_account.id
+            dumps = current_app.json.dumps
+            
+            def generate():
+                for entry in LoyaltyLedger.stream_for_account(account_id):
+                    yield dumps(entry) + "\n"
+            
+            return Response(
+                stream_with_context(generate()),
+                mimetype="application/x-ndjson",
+                headers={"Content-Disposition": "attachment; filename=loyalty-ledger.ndjson"},
+            )
+        except Exception as e:
+            log_error("Failed to export loyalty ledger", error=e)
+            return error_response("Failed to export loyalty ledger", 500)
+
@@ -50,5 +50,23 @@ def get_ledger():
     return LoyaltyController.get_ledger()
 
 
+@bp.get("/ledger/export")
+@customer_required
+@endpoint(
+    security=SecurityScheme.PUBLIC_BEARER,
+    tags=["Loyalty"],
+    summary="Export Loyalty Ledger",
+    description="Stream the full loyalty points history as newline-delimited JSON",
+    responses={
+        "200": None,
+        "401": None,
+        "500": None,
+    },
+)
+def export_ledger():
+    """Export all loyalty ledger entries."""
+    return LoyaltyController.export_ledger()
+
+
 
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from flask import Response, request
+from sqlalchemy.orm import selectinload, undefer_group
 import uuid
 
 from app.extensions import db
 from quas_utils.api import success_response, error_response
 from app.utils.helpers.user import get_current_user
-from app.models.order import Order
+from app.models.order import Order, OrderItem
 from app.models.user import AppUser
 from app.enums.orders import OrderStatus
 from app.logging import log_error, log_event
@@ -60,7 +61,7 @@ class OrdersController:
                 {"order": order.to_dict(include_items=True)}
             )
         except Exception as e:
-            log_error(f"Failed to cancel order {order_id}", error=e)
+            log_error("Failed to cancel order", error=e, order_id=order_id)
             db.session.rollback()
             return error_response("Failed to cancel order", 500)
 
@@ -76,9 +77,9 @@ class OrdersController:
             guest_email = request.args.get("email")
             
             # Debug logging
-            log_event(f"list_orders called: current_user={current_user}, guest_email={guest_email}")
+            log_event("list_orders called", authenticated=bool(current_user), guest_email=guest_email)
             if current_user:
-                log_event(f"list_orders: user_id={current_user.id}, email={current_user.email}")
+                log_event("list_orders for user", user_id=current_user.id, email=current_user.email)
             
             if not current_user and not guest_email:
                 return error_response("Unauthorized or email required for guest orders", 401)
@@ -86,13 +87,14 @@ class OrdersController:
             page = request.args.get("page", 1, type=int)
             per_page = request.args.get("per_page", 20, type=int)
             
-            query = Order.query
+            # Items and their variants are loaded in two batched queries, not per order
+            query = Order.query.options(selectinload(Order.items).selectinload(OrderItem.variant), undefer_group("order_detail"))
             if current_user:
                 query = query.filter_by(user_id=current_user.id)
                 # Debug: count all orders and user's orders
                 total_orders = Order.query.count()
                 user_orders = Order.query.filter_by(user_id=current_user.id).count()
-                log_event(f"list_orders: total_orders={total_orders}, user_orders={user_orders}")
+                log_event("list_orders counts", total_orders=total_orders, user_orders=user_orders)
             elif guest_email:
                 query = query.filter_by(guest_email=guest_email)
             
@@ -144,10 +146,11 @@ class OrdersController:
                 order_number = order_id.upper()  # Normalize to uppercase
             
             # Build query based on identifier type
+            query = Order.query.options(selectinload(Order.items).selectinload(OrderItem.variant), undefer_group("order_detail"))
             if order_uuid:
-                query = Order.query.filter_by(id=order_uuid)
+                query = query.filter_by(id=order_uuid)
             else:
-                query = Order.query.filter_by(order_number=order_number)
+                query = query.filter_by(order_number=order_number)
             
             # Apply user/guest filter
             if guest_email:
@@ -166,7 +169,7 @@ class OrdersController:
                 {"order": order.to_dict(include_items=True)}
             )
         except Exception as e:
-            log_error(f"Failed to fetch order {order_id}", error=e)
+            log_error("Failed to fetch order", error=e, order_id=order_id)
             return error_response("Failed to fetch order", 500)
 
 
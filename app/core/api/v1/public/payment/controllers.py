@@ -252,7 +252,7 @@ class PaymentController:
                 }
             )
         except Exception as e:
-            log_error(f"Failed to fetch payment status {tx_id}", error=e)
+            log_error("Failed to fetch payment status", error=e, tx_id=tx_id)
             return error_response("Failed to fetch payment status", 500)
     
     @staticmethod
@@ -293,7 +293,7 @@ class PaymentController:
             payments: list[Payment] = pagination.items
             
             # Convert to dict
-            payment_list = [payment.to_dict() for payment in payments]
+            payment_list = Payment.to_dict_bulk(payments)
             
             response_data = {
                 "total": pagination.total,
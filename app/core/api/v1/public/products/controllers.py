@@ -32,7 +32,7 @@ class ProductController:
             filters = ProductFilterRequest.model_validate(request.args.to_dict())
             
             # Build base query
-            query: Query = Product.query.filter(Product.deleted_at.is_(None))
+            query: Query = Product.query.options(*Product.list_options()).filter(Product.deleted_at.is_(None))
             
             # Apply search filter
             if filters.search:
@@ -42,6 +42,23 @@ class ProductController:
             if filters.category:
                 query = query.filter(Product.category == filters.category)
             
+            # Only keep products with an active variant matching every requested attribute,
+            # so pagination counts them correctly (served by the attributes GIN index)
+            attribute_filters = {
+                key: value for key, value in (
+                    ("texture", filters.texture),
+                    ("length", filters.length),
+                    ("color", filters.color),
+                    ("lace_type", filters.lace_type),
+                    ("density", filters.density),
+                ) if value
+            }
+            if attribute_filters:
+                query = query.filter(Product.variants.any(and_(
+                    ProductVariant.deleted_at.is_(None),
+                    ProductVariant.attributes.contains(attribute_filters),
+                )))
+            
             # Apply launch status filter (default to in stock)
             if filters.in_stock_only:
                 query = query.filter(Product.launch_status.in_([
@@ -67,6 +84,7 @@ class ProductController:
             # Filter variants by attributes if provided
             # This is a simplified approach - in production, you'd want more sophisticated filtering
             product_data = []
+            material_cache: dict = {}  # materials repeat across products, serialize each once
             for product in products:
                 variants = [v for v in product.variants if v.deleted_at is None]
                 
@@ -100,7 +118,7 @@ class ProductController:
                 if filters.price_min or filters.price_max:
                     price_filtered_variants = []
                     for variant in variants:
-                        price = float(variant.price_ngn)
+                        price = variant.price_ngn
                         if filters.price_min and price < float(filters.price_min):
                             continue
                         if filters.price_max and price > float(filters.price_max):
@@ -117,8 +135,8 @@ class ProductController:
                     if not variants:
                         continue
                 
-                product_dict = product.to_dict(include_variants=False)
-                product_dict["variants"] = [v.to_dict(include_inventory=True) for v in variants]
+                product_dict = product.to_dict(include_variants=False, material_cache=material_cache)
+                product_dict["variants"] = [v.to_dict(include_inventory=True, material_cache=material_cache) for v in variants]
                 product_data.append(product_dict)
             
             return success_response(
@@ -58,7 +58,7 @@ class RevampController:
             db.session.add(revamp_request)
             db.session.commit()
             
-            log_event(f"Revamp request created: {revamp_request.id} for order item {order_item_uuid}")
+            log_event("Revamp request created", request_id=revamp_request.id, order_item_id=order_item_uuid)
             
             return success_response(
                 "Revamp request created successfully",
@@ -103,7 +103,7 @@ class RevampController:
                 {"revamp_request": revamp_request.to_dict()}
             )
         except Exception as e:
-            log_error(f"Failed to get revamp request {revamp_id}", error=e)
+            log_error("Failed to get revamp request", error=e, revamp_id=revamp_id)
             return error_response("Failed to retrieve revamp request", 500)
 
 
@@ -44,7 +44,7 @@ class WaitlistController:
             db.session.add(entry)
             db.session.commit()
             
-            log_event(f"Waitlist entry created: {entry.id} for {payload.email}")
+            log_event("Waitlist entry created", entry_id=entry.id, email=payload.email)
             
             return success_response(
                 "Successfully joined the waitlist! We'll notify you when we launch.",
@@ -109,7 +109,7 @@ class WishlistController:
             db.session.add(wishlist_item)
             db.session.commit()
             
-            log_event(f"Added variant {variant_id} to wishlist for user {current_user.id}")
+            log_event("Added variant to wishlist", variant_id=variant_id, user_id=current_user.id)
             
             return success_response(
                 "Item added to wishlist successfully",
@@ -152,7 +152,7 @@ class WishlistController:
             db.session.delete(wishlist_item)
             db.session.commit()
             
-            log_event(f"Removed wishlist item {item_id} for user {current_user.id}")
+            log_event("Removed wishlist item", item_id=item_id, user_id=current_user.id)
             
             return success_response("Item removed from wishlist successfully", 200)
         except Exception as e:
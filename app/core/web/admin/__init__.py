@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from flask import Blueprint, request, redirect, url_for
+from flask import Blueprint, request, redirect
 
 from .home import bp as home_bp
 from .auth import bp as auth_bp
@@ -11,6 +11,8 @@ from .orders import bp as orders_bp
 from .materials import bp as materials_bp
 from .users import bp as users_bp
 from app.utils.decorators.auth import roles_required_web, ADMIN_ALLOWED_ROLES
+from app.templating import warm_templates
+from app.utils.helpers.routing import cached_url_for_next
 
 
 def create_web_admin_blueprint():
@@ -27,6 +29,12 @@ def create_web_admin_blueprint():
     web_admin_bp.register_blueprint(materials_bp)
     web_admin_bp.register_blueprint(users_bp)
 
+    # Compile the heaviest admin pages at startup instead of on the first visit
+    web_admin_bp.record_once(lambda state: warm_templates(state.app, [
+        "admin/pages/users/list.html",
+        "admin/pages/users/view.html",
+    ]))
+
     @web_admin_bp.before_request
     def _require_admin_access():
         """Protect all admin routes except the auth endpoints (login, callbacks)."""
@@ -47,7 +55,7 @@ def create_web_admin_blueprint():
         except Exception:
             # If any exception occurs during auth, redirect to login
             # This prevents API error handlers from catching web admin errors
-            return redirect(url_for("web.web_admin.web_admin_auth.login", next=request.url, _external=False))
+            return redirect(cached_url_for_next("web.web_admin.web_admin_auth.login"))
 
         return None
 
@@ -33,7 +33,8 @@ def categories():
             per_page=per_page,
             paginate=True,
             parent_only=parent_only,
-            search_term=search_term
+            search_term=search_term,
+            with_media=True,  # the list renders thumbnails
         )
         
         # Calculate total pages
@@ -73,7 +74,7 @@ def view_category(category_id: str):
             category_data=category_data
         )
     except Exception as e:
-        log_error(f"Failed to view category {category_id}", error=e)
+        log_error("Failed to view category", error=e, category_id=category_id)
         flash("Failed to load category. Please try again.", "error")
         return redirect(url_for("web.web_admin.categories.categories"))
 
@@ -173,11 +174,11 @@ def edit_category(category_id: str):
             category=category
         )
     except Exception as e:
-        log_error(f"Failed to load edit category {category_id}", error=e)
+        log_error("Failed to load edit category", error=e, category_id=category_id)
         flash("Failed to load category. Please try again.", "error")
         return redirect(url_for("web.web_admin.categories.categories"))
     except Exception as e:
-        log_error(f"Failed to load edit category {category_id}", error=e)
+        log_error("Failed to load edit category", error=e, category_id=category_id)
         flash("Failed to load category. Please try again.", "error")
         return redirect(url_for("web.web_admin.categories.categories"))
 
@@ -213,7 +214,7 @@ def delete_category(category_id: str):
         flash(f"Category '{category_name}' deleted successfully", "success")
         return redirect(url_for("web.web_admin.categories.categories"))
     except Exception as e:
-        log_error(f"Failed to delete category {category_id}", error=e)
+        log_error("Failed to delete category", error=e, category_id=category_id)
         db.session.rollback()
         flash("Failed to delete category. Please try again.", "error")
         return redirect(url_for("web.web_admin.categories.categories"))
@@ -64,7 +64,7 @@ def add_material():
             
             current_user = getattr(g, 'current_user', None)
             if current_user:
-                log_event(f"Material created: {material.id} by admin {current_user.id}")
+                log_event("Material created", material_id=material.id, admin_id=current_user.id)
             
             flash(f"Material '{name}' created successfully.", "success")
             return redirect(url_for("web.web_admin.materials.materials"))
@@ -116,7 +116,7 @@ def edit_material(material_id: str):
         
     except Exception as e:
         db.session.rollback()
-        log_error(f"Failed to edit material {material_id}", error=e)
+        log_error("Failed to edit material", error=e, material_id=material_id)
         flash("Failed to update material. Please try again.", "error")
         return redirect(url_for("web.web_admin.materials.materials"))
 
@@ -144,7 +144,7 @@ def delete_material(material_id: str):
         
     except Exception as e:
         db.session.rollback()
-        log_error(f"Failed to delete material {material_id}", error=e)
+        log_error("Failed to delete material", error=e, material_id=material_id)
         flash("Failed to delete material. Please try again.", "error")
     
     return redirect(url_for("web.web_admin.materials.materials"))
@@ -64,6 +64,6 @@ def view_order(order_id: str):
             OrderStatus=OrderStatus
         )
     except Exception as e:
-        log_error(f"Failed to view order {order_id}", error=e)
+        log_error("Failed to view order", error=e, order_id=order_id)
         flash("Failed to load order. Please try again.", "error")
         return redirect(url_for("web.web_admin.orders.orders"))
@@ -27,8 +27,8 @@ def products():
         category = request.args.get('category', type=str)
         status = request.args.get('status', type=str)
         
-        # Build query
-        query = Product.query
+        # Build query; the list only shows variant aggregates, so those come from SQL
+        query = Product.with_summary(Product.query.options(*Product.list_options(include_variants=False)))
         
         # Apply search filter
         if search_term:
@@ -49,10 +49,7 @@ def products():
         pagination = query.paginate(page=page, per_page=per_page, error_out=False)
         
         # Convert products to dict with images for template
-        products_with_images = []
-        for product in pagination.items:
-            product_dict = product.to_dict(include_variants=False)
-            products_with_images.append(product_dict)
+        products_with_images = Product.list_to_dicts(pagination.items)
         
         # Create a custom pagination-like object with products that have image data
         class PaginationWrapper:
@@ -107,7 +104,7 @@ def view_product(identifier: str):
             product_data=product_data
         )
     except Exception as e:
-        log_error(f"Failed to view product {identifier}", error=e)
+        log_error("Failed to view product", error=e, identifier=identifier)
         flash("Failed to load product. Please try again.", "error")
         return redirect(url_for("web.web_admin.products.products"))
 
@@ -139,7 +136,7 @@ def add_new_product():
                 
                 current_user = getattr(g, 'current_user', None)
                 if current_user:
-                    log_event(f"Product created: {product.id} by admin {current_user.id}")
+                    log_event("Product created", product_id=product.id, admin_id=current_user.id)
                 
                 flash(f"Product '{product.name}' created successfully", "success")
                 return redirect(url_for("web.web_admin.products.view_product", identifier=product.id))
@@ -215,7 +212,7 @@ def edit_product(identifier: str):
                     
                     current_user = getattr(g, 'current_user', None)
                     if current_user:
-                        log_event(f"Product updated: {product.id} by admin {current_user.id}")
+                        log_event("Product updated", product_id=product.id, admin_id=current_user.id)
                     
                     flash(f"Product '{product.name}' updated successfully", "success")
                     return redirect(url_for("web.web_admin.products.view_product", identifier=product.id))
@@ -223,7 +220,7 @@ def edit_product(identifier: str):
                 except ValueError as e:
                     flash(str(e), "error")
                 except Exception as e:
-                    log_error(f"Failed to update product {product.id}", error=e)
+                    log_error("Failed to update product", error=e, product_id=product.id)
                     flash("Failed to update product. Please try again.", "error")
             else:
                 # Form validation failed
@@ -246,8 +243,8 @@ def edit_product(identifier: str):
                 variant_dict = {
                     'name': variant_name,
                     'sku': variant.sku,
-                    'price_ngn': float(variant.price_ngn),
-                    'price_usd': float(variant.price_usd) if variant.price_usd else 0,
+                    'price_ngn': variant.price_ngn,
+                    'price_usd': variant.price_usd or 0,
                     'quantity': variant.inventory.quantity if variant.inventory else 0,
                     'low_stock_threshold': variant.inventory.low_stock_threshold if variant.inventory else 5,
                     'weight_g': variant.weight_g or 0,
@@ -264,7 +261,7 @@ def edit_product(identifier: str):
             existing_variants=existing_variants_data
         )
     except Exception as e:
-        log_error(f"Failed to load edit product {identifier}", error=e)
+        log_error("Failed to load edit product", error=e, identifier=identifier)
         flash("Failed to load product. Please try again.", "error")
         return redirect(url_for("web.web_admin.products.products"))
 
@@ -290,7 +287,7 @@ def delete_product(identifier: str):
         flash(f"Product '{product_name}' deleted successfully", "success")
         return redirect(url_for("web.web_admin.products.products"))
     except Exception as e:
-        log_error(f"Failed to delete product {identifier}", error=e)
+        log_error("Failed to delete product", error=e, identifier=identifier)
         db.session.rollback()
         flash("Failed to delete product. Please try again.", "error")
         return redirect(url_for("web.web_admin.products.products"))
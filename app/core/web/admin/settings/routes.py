@@ -144,7 +144,7 @@ def payment_setup(method):
                     flash("CSRF validation failed. Please refresh and try again.", "danger")
                 else:
                     flash(f"Error in {field_name}: {err}", "danger")
-                log_error(f"Validation error in {field_name}", err)
+                log_error("Validation error", err, field_name=field_name)
     
 
     return render_template("admin/pages/settings/payment_setup.html", page_name=page_name, method=method, settings=current_settings, method_overview=method_overview, form=form)
@@ -1,54 +1,105 @@
 from __future__ import annotations
 
-from flask import render_template, request, flash, redirect, url_for
+from flask import render_template, request, flash, redirect, current_app, make_response, session, stream_template
+from sqlalchemy import select, func
+from sqlalchemy.orm import selectinload, raiseload
 from . import bp
+from app.extensions import db
 from app.models.user import AppUser
+from app.models.role import UserRole
 from app.models.order import Order
-from sqlalchemy import desc
 from app.logging import log_error
+from app.utils.helpers.pagination import keyset_paginate
+from app.utils.helpers.routing import cached_url_for
+from app.utils.helpers.uuid_helpers import validate_uuid
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100  # Keeps a hand-edited ?per_page= from loading the whole table
 
 @bp.route("/", methods=["GET"])
 def users():
-    """List all registered users with search and pagination."""
+    """List all registered users with search and keyset (cursor) pagination."""
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
+        raw_per_page = request.args.get('per_page', '')
+        # isdecimal() screens out junk without going through int()'s exception path
+        per_page = min(max(int(raw_per_page), 1), MAX_PER_PAGE) if raw_per_page.isdecimal() else DEFAULT_PER_PAGE
+        after = request.args.get('after')
+        before = request.args.get('before')
         search_term = request.args.get('search', '').strip()
         
-        query = AppUser.query.order_by(AppUser.date_joined.desc())
+        has_flashes = "_flashes" in session
+        
+        # Rows must be fully loaded up front: a streamed body renders after the
+        # session has been closed by the after-request hook
+        query = AppUser.query.options(
+            selectinload(AppUser.profile),
+            selectinload(AppUser.roles).selectinload(UserRole.role),
+        )
         
         if search_term:
             query = AppUser.add_search_filters(query, search_term)
-            
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
         
-        return render_template(
-            "admin/pages/users/list.html",
-            pagination=pagination,
-            total_pages=pagination.pages,
-            search_term=search_term
+        pagination = keyset_paginate(
+            query, AppUser.date_joined, AppUser.id,
+            per_page=per_page, after=after, before=before
         )
+        
+        context = dict(pagination=pagination, per_page=per_page, search_term=search_term)
+        if per_page > DEFAULT_PER_PAGE and not has_flashes:
+            # Start sending large pages while later rows are still rendering. Not
+            # done with pending flashes: popping them mid-stream would happen
+            # after the session cookie has already been written.
+            response = current_app.response_class(
+                stream_template("admin/pages/users/list.html", **context),
+                mimetype="text/html"
+            )
+        else:
+            response = make_response(render_template("admin/pages/users/list.html", **context))
+        return response
     except Exception as e:
         log_error("Failed to list users in admin", error=e)
         flash("An error occurred while loading users.", "error")
-        return redirect(url_for("web.web_admin.web_admin_home.index"))
+        return redirect(cached_url_for("web.web_admin.web_admin_home.index"))
 
 @bp.route("/<user_id>", methods=["GET"])
 def view_user(user_id: str):
     """View details of a specific user."""
     try:
-        user = AppUser.query.get(user_id)
+        # Load everything the detail page renders up front instead of lazily per attribute
+        options = [
+            selectinload(AppUser.profile),
+            selectinload(AppUser.address),
+            selectinload(AppUser.wallet),
+            selectinload(AppUser.roles).selectinload(UserRole.role),
+        ]
+        if current_app.debug:
+            # Surface any relationship the template touches without eager-loading it
+            options.append(raiseload("*"))
+        
+        # A malformed id can't match any user; don't send it to the database
+        user_uuid = validate_uuid(user_id)
+        user = db.session.get(AppUser, user_uuid, options=options) if user_uuid else None
         if not user:
             flash("User not found.", "error")
-            return redirect(url_for("web.web_admin.users.users"))
-            
+            return redirect(cached_url_for("web.web_admin.users.users"))
+        
+        recent_orders = (
+            Order.query.filter(Order.user_id == user.id)
+            .order_by(Order.created_at.desc())
+            .limit(5)
+            .all()
+        )
+        order_count = db.session.scalar(
+            select(func.count()).select_from(Order).where(Order.user_id == user.id)
+        )
+        
         return render_template(
             "admin/pages/users/view.html",
             user=user,
-            Order=Order,
-            desc=desc
+            recent_orders=recent_orders,
+            order_count=order_count
         )
     except Exception as e:
-        log_error(f"Failed to view user {user_id}", error=e)
+        log_error("Failed to view user", error=e, user_id=user_id)
         flash("An error occurred while loading the user details.", "error")
-        return redirect(url_for("web.web_admin.users.users"))
+        return redirect(cached_url_for("web.web_admin.users.users"))
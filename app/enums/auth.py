@@ -1,7 +1,8 @@
-from enum import Enum
+from enum import StrEnum, unique
 
 
-class RoleNames(Enum):
+@unique
+class RoleNames(StrEnum):
     """ENUMS for the name filed in Role Model"""
     SUPER_ADMIN = "Super Admin" # System configuration access
     ADMIN = "Admin" # Full access to dashboard/operations
@@ -15,7 +16,5 @@ class RoleNames(Enum):
 
     @classmethod
     def get_member_by_value(cls, value):
-        return next((member for name, member in cls.__members__.items() if member.value == value), None)
-    
-    def __str__(self):
-        return self.value
\ No newline at end of file
+        # Enum keeps a value -> member map; a dict lookup beats scanning every member
+        return cls._value2member_map_.get(value)
\ No newline at end of file
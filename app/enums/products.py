@@ -2,20 +2,19 @@
 Enums for product-related models.
 """
 
-from enum import Enum
+from enum import StrEnum, unique
 
 
-class ProductCategory(Enum):
+@unique
+class ProductCategory(StrEnum):
     """Product categories."""
     WIGS = "Wigs"
     BUNDLES = "Bundles"
     HAIR_CARE = "Hair Care"
-    
-    def __str__(self):
-        return self.value
 
 
-class HairType(Enum):
+@unique
+class HairType(StrEnum):
     """Hair type options."""
     HUMAN_HAIR = "Human Hair"
     VIRGIN = "Virgin"
@@ -25,67 +24,54 @@ class HairType(Enum):
     WAVY = "Wavy"
     KINKY = "Kinky"
     COILY = "Coily"
-    
-    def __str__(self):
-        return self.value
 
 
-class Texture(Enum):
+@unique
+class Texture(StrEnum):
     """Hair texture options."""
     BODY_WAVE = "Body Wave"
     LOOSE_WAVE = "Loose Wave"
     DEEP_WAVE = "Deep Wave"
     STRAIGHT = "Straight"
     CURLY = "Curly"
-    
-    def __str__(self):
-        return self.value
 
 
-class LaceType(Enum):
+@unique
+class LaceType(StrEnum):
     """Lace type options."""
     LACE_13X4 = "13x4"
     LACE_13X6 = "13x6"
     LACE_360 = "360"
     FULL_LACE = "Full Lace"
     NO_LACE = "No Lace"
-    
-    def __str__(self):
-        return self.value
 
 
-class Density(Enum):
+@unique
+class Density(StrEnum):
     """Hair density options."""
     LIGHT = "Light"
     MEDIUM = "Medium"
     HEAVY = "Heavy"
     EXTRA_HEAVY = "Extra Heavy"
-    
-    def __str__(self):
-        return self.value
 
 
-class CapSize(Enum):
+@unique
+class CapSize(StrEnum):
     """Cap size options."""
     SMALL = "Small"
     MEDIUM = "Medium"
     LARGE = "Large"
     ADJUSTABLE = "Adjustable"
-    
-    def __str__(self):
-        return self.value
 
 
-class LaunchStatus(Enum):
+@unique
+class LaunchStatus(StrEnum):
     """Product launch status."""
     NEW_DROP = "New Drop"
     LIMITED_EDITION = "Limited Edition"
     PRE_ORDER = "Pre-Order"
     IN_STOCK = "In-Stock"
     OUT_OF_STOCK = "Out of Stock"
-    
-    def __str__(self):
-        return self.value
 
 
 
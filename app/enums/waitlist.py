@@ -1,13 +1,11 @@
-from enum import Enum
+from enum import StrEnum, unique
 
 
-class WaitlistStatus(Enum):
+@unique
+class WaitlistStatus(StrEnum):
     """
     Enumeration of possible waitlist entry statuses.
     """
     PENDING = "pending"
     INVITED = "invited"
     CONVERTED = "converted"
-
-    def __str__(self):
-        return self.value
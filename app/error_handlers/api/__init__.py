@@ -7,18 +7,17 @@ endpoints can avoid repetitive try/except blocks and always return JSON.
 
 from flask import Blueprint
 
+from .http import add_http_err_handlers
+from .jwt import add_jwt_err_handler
+from .email import add_email_err_handler
+from .pydantic import add_pydantic_err_handlers
+from .db import add_db_err_handlers
+from .unexpected import add_unexpected_err_handler
 
 
 def attach_api_err_handlers(bp: Blueprint) -> None:
     """Register common JSON error handlers on the given blueprint."""
     
-    from .http import add_http_err_handlers
-    from .jwt import add_jwt_err_handler
-    from .email import add_email_err_handler
-    from .pydantic import add_pydantic_err_handlers
-    from .db import add_db_err_handlers
-    from .unexpected import add_unexpected_err_handler
-
     # HTTPException → use provided code/description
     add_http_err_handlers(bp)
 
@@ -36,5 +35,3 @@ def attach_api_err_handlers(bp: Blueprint) -> None:
 
     # Catch-all → 500
     add_unexpected_err_handler(bp)
-
-
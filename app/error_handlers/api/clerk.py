@@ -12,6 +12,7 @@ from flask import Blueprint, request
 
 from app.logging import log_error
 from quas_utils.api import error_response
+from ..dispatch import lookup
 
 
 class ClerkAuthError(Exception):
@@ -39,29 +40,20 @@ class RevokedClerkTokenError(ClerkAuthError):
     pass
 
 
-def _handle_invalid_token(err: InvalidClerkTokenError | Any):
-    log_error("Invalid Clerk token", err, path=request.path)
-    return error_response("Invalid or malformed token", 401)
+# exception -> (log message, response message, status)
+_CLERK_ERRORS: dict[type, tuple[str, str, int]] = {
+    InvalidClerkTokenError: ("Invalid Clerk token", "Invalid or malformed token", 401),
+    ExpiredClerkTokenError: ("Expired Clerk token", "Token expired", 401),
+    MissingClerkTokenError: ("Missing Clerk token", "Authorization required", 401),
+    RevokedClerkTokenError: ("Revoked Clerk token", "Token revoked", 401),
+    ClerkAuthError: ("Clerk authentication error", "Authentication failed", 401),
+}
 
 
-def _handle_expired_token(err: ExpiredClerkTokenError | Any):
-    log_error("Expired Clerk token", err, path=request.path)
-    return error_response("Token expired", 401)
-
-
-def _handle_missing_token(err: MissingClerkTokenError | Any):
-    log_error("Missing Clerk token", err, path=request.path)
-    return error_response("Authorization required", 401)
-
-
-def _handle_revoked_token(err: RevokedClerkTokenError | Any):
-    log_error("Revoked Clerk token", err, path=request.path)
-    return error_response("Token revoked", 401)
-
-
-def _handle_clerk_auth_error(err: ClerkAuthError | Any):
-    log_error("Clerk authentication error", err, path=request.path)
-    return error_response("Authentication failed", 401)
+def _handle_clerk_error(err: ClerkAuthError | Any):
+    log_msg, resp_msg, status = lookup(_CLERK_ERRORS, err)
+    log_error(log_msg, err, path=request.path)
+    return error_response(resp_msg, status)
 
 
 def add_clerk_err_handler(bp: Blueprint):
@@ -71,16 +63,5 @@ def add_clerk_err_handler(bp: Blueprint):
     Args:
         bp: The Flask blueprint to register handlers on.
     """
-    bp.register_error_handler(InvalidClerkTokenError, _handle_invalid_token)
-    bp.register_error_handler(ExpiredClerkTokenError, _handle_expired_token)
-    bp.register_error_handler(MissingClerkTokenError, _handle_missing_token)
-    bp.register_error_handler(RevokedClerkTokenError, _handle_revoked_token)
-    bp.register_error_handler(ClerkAuthError, _handle_clerk_auth_error)
-
-
-
-
-
-
-
-
+    for exc in _CLERK_ERRORS:
+        bp.register_error_handler(exc, _handle_clerk_error)
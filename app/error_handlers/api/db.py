@@ -13,64 +13,26 @@ from sqlalchemy.exc import (
 
 from app.logging import log_error
 from quas_utils.api import error_response
+from ..session import rollback_session
+from ..dispatch import lookup
 
 # Database errors → rollback and return appropriate code
-def _rollback():
-    try:
-        from app.extensions import db  # lazy import to avoid circulars
-        db.session.rollback()
-    except Exception:
-        pass
-
-def _handle_integrity(err: IntegrityError):
-    # Only handle API routes - let web handlers deal with non-API routes
-    if not request.path.startswith("/api"):
-        raise err
-    
-    _rollback()
-    log_error("Integrity error", err, path=request.path)
-    return error_response("conflict with existing data", 409)
-
-def _handle_data(err: DataError):
-    # Only handle API routes - let web handlers deal with non-API routes
-    if not request.path.startswith("/api"):
-        raise err
-    
-    _rollback()
-    log_error("Invalid data", err, path=request.path)
-    return error_response("invalid data", 400)
-
-def _handle_invalid_request(err: InvalidRequestError):
-    # Only handle API routes - let web handlers deal with non-API routes
-    if not request.path.startswith("/api"):
-        raise err
-    
-    _rollback()
-    log_error("Invalid request", err, path=request.path)
-    return error_response("invalid request", 400)
-
-def _handle_db_operational(err: OperationalError):
-    # Only handle API routes - let web handlers deal with non-API routes
-    if not request.path.startswith("/api"):
-        raise err
-    
-    _rollback()
-    log_error("Database operational error", err, path=request.path)
-    return error_response("database error", 500)
-
-def _handle_db_generic(err: DatabaseError):
-    # Only handle API routes - let web handlers deal with non-API routes
-    if not request.path.startswith("/api"):
-        raise err
-    
-    _rollback()
-    log_error("Database error", err, path=request.path)
-    return error_response("database error", 500)
+# exception -> (log message, response message, status)
+_DB_ERRORS: dict[type, tuple[str, str, int]] = {
+    IntegrityError: ("Integrity error", "conflict with existing data", 409),
+    DataError: ("Invalid data", "invalid data", 400),
+    InvalidRequestError: ("Invalid request", "invalid request", 400),
+    OperationalError: ("Database operational error", "database error", 500),
+    DatabaseError: ("Database error", "database error", 500),
+}
+
+def _handle_db_error(err: DatabaseError | InvalidRequestError):
+    rollback_session()
+    log_msg, resp_msg, status = lookup(_DB_ERRORS, err)
+    log_error(log_msg, err, path=request.path)
+    return error_response(resp_msg, status)
 
 
 def add_db_err_handlers(bp: Blueprint):
-    bp.register_error_handler(IntegrityError, _handle_integrity)
-    bp.register_error_handler(DataError, _handle_data)
-    bp.register_error_handler(InvalidRequestError, _handle_invalid_request)
-    bp.register_error_handler(OperationalError, _handle_db_operational)
-    bp.register_error_handler(DatabaseError, _handle_db_generic)
+    for exc in _DB_ERRORS:
+        bp.register_error_handler(exc, _handle_db_error)
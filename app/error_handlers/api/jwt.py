@@ -7,6 +7,7 @@ from werkzeug.exceptions import HTTPException, UnsupportedMediaType
 
 from app.logging import log_error
 from quas_utils.api import error_response
+from ..dispatch import lookup
 
 try:  # jwt-related exceptions are optional at import time
     from flask_jwt_extended.exceptions import (
@@ -34,44 +35,23 @@ except Exception:  # pragma: no cover
 
 
 # JWT / auth errors → 401/403
-def _handle_jwt_decode(err: JWTDecodeError):  # type: ignore[name-defined]
-    log_error("Invalid token", err, path=request.path)
-    return error_response("invalid token", 401)
-
-def _handle_expired(err: ExpiredSignatureError):  # type: ignore[name-defined]
-    log_error("Token expired", err, path=request.path)
-    return error_response("token expired", 401)
-
-def _handle_no_auth(err: NoAuthorizationError):  # type: ignore[name-defined]
-    log_error("Authorization missing", err, path=request.path)
-    return error_response("authorization required", 401)
-
-def _handle_invalid_header(err: InvalidHeaderError):  # type: ignore[name-defined]
-    log_error("Invalid auth header", err, path=request.path)
-    return error_response("invalid authorization header", 401)
-
-def _handle_wrong_token(err: WrongTokenError):  # type: ignore[name-defined]
-    log_error("Wrong token", err, path=request.path)
-    return error_response("wrong token type", 401)
-
-def _handle_revoked(err: RevokedTokenError):  # type: ignore[name-defined]
-    log_error("Revoked token", err, path=request.path)
-    return error_response("token revoked", 401)
-
-def _handle_fresh_required(err: FreshTokenRequired):  # type: ignore[name-defined]
-    log_error("Fresh token required", err, path=request.path)
-    return error_response("fresh token required", 401)
-
-def _handle_csrf(err: CSRFError):  # type: ignore[name-defined]
-    log_error("CSRF error", err, path=request.path)
-    return error_response("csrf error", 401)
+# exception -> (log message, response message, status)
+_JWT_ERRORS: dict[type, tuple[str, str, int]] = {
+    JWTDecodeError: ("Invalid token", "invalid token", 401),
+    ExpiredSignatureError: ("Token expired", "token expired", 401),
+    NoAuthorizationError: ("Authorization missing", "authorization required", 401),
+    InvalidHeaderError: ("Invalid auth header", "invalid authorization header", 401),
+    WrongTokenError: ("Wrong token", "wrong token type", 401),
+    RevokedTokenError: ("Revoked token", "token revoked", 401),
+    FreshTokenRequired: ("Fresh token required", "fresh token required", 401),
+    CSRFError: ("CSRF error", "csrf error", 401),
+}
+
+def _handle_jwt_error(err: Exception):
+    log_msg, resp_msg, status = lookup(_JWT_ERRORS, err)
+    log_error(log_msg, err, path=request.path)
+    return error_response(resp_msg, status)
 
 def add_jwt_err_handler(bp: Blueprint):
-    bp.register_error_handler(JWTDecodeError, _handle_jwt_decode)  # type: ignore[arg-type]
-    bp.register_error_handler(ExpiredSignatureError, _handle_expired)  # type: ignore[arg-type]
-    bp.register_error_handler(NoAuthorizationError, _handle_no_auth)  # type: ignore[arg-type]
-    bp.register_error_handler(InvalidHeaderError, _handle_invalid_header)  # type: ignore[arg-type]
-    bp.register_error_handler(WrongTokenError, _handle_wrong_token)  # type: ignore[arg-type]
-    bp.register_error_handler(RevokedTokenError, _handle_revoked)  # type: ignore[arg-type]
-    bp.register_error_handler(FreshTokenRequired, _handle_fresh_required)  # type: ignore[arg-type]
-    bp.register_error_handler(CSRFError, _handle_csrf)  # type: ignore[arg-type]
\ No newline at end of file
+    for exc in _JWT_ERRORS:
+        bp.register_error_handler(exc, _handle_jwt_error)  # type: ignore[arg-type]
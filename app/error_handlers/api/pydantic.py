@@ -20,17 +20,34 @@ except Exception:  # pragma: no cover
 
 # Pydantic validation errors → 400 with structured details
 def _serialize_pydantic_errors(err: Any) -> list[dict[str, Any]]:
-        try:
-            return [
-                {
-                    "loc": list(getattr(e, "loc", ())),
-                    "msg": getattr(e, "msg", str(e)),
-                    "type": getattr(e, "type", "value_error"),
-                }
-                for e in err.errors()  # type: ignore[attr-defined]
-            ]
-        except Exception:
-            return [{"msg": str(err)}]
+    cached = getattr(err, "_serialized_errors", None)
+    if cached is not None:
+        return cached
+
+    try:
+        # Skip the docs URL and input repr; they are the costly parts of errors()
+        raw_errors = err.errors(include_url=False, include_input=False)  # type: ignore[attr-defined]
+    except TypeError:
+        raw_errors = err.errors()  # type: ignore[attr-defined]
+    except Exception:
+        return [{"msg": str(err)}]
+
+    # pydantic returns plain dicts, so read keys directly
+    serialized = [
+        {
+            "loc": list(e.get("loc", ())),
+            "msg": e.get("msg", str(e)),
+            "type": e.get("type", "value_error"),
+        }
+        for e in raw_errors
+    ]
+
+    try:
+        err._serialized_errors = serialized
+    except AttributeError:
+        pass  # Some compiled exception types don't accept new attributes
+
+    return serialized
 
 def _handle_pydantic_validation(err: PydanticValidationError):  # type: ignore[name-defined]
     log_error("Validation error", err, path=request.path)
@@ -0,0 +1,39 @@
+"""
+Table-driven error dispatch shared by the API and web error handler modules.
+
+Each module maps exception classes to the log message and response it
+produces, then registers a single handler for every class in its table.
+"""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+# (id(table), exception class) -> resolved entry. Tables are module-level
+# constants, so their ids are stable for the life of the process.
+_resolved: dict[tuple[int, type], Any] = {}
+
+
+def lookup(table: dict[type, T], err: BaseException) -> T:
+    """
+    Return the table entry for the most specific class of `err`.
+
+    Walks the MRO the same way Flask does when picking a handler, so an
+    exception subclass resolves to its nearest registered ancestor. The
+    result is memoized per class, so a recurring exception costs one dict hit.
+    """
+    err_cls = type(err)
+    key = (id(table), err_cls)
+    try:
+        return _resolved[key]
+    except KeyError:
+        pass
+    
+    for cls in err_cls.__mro__:
+        if cls in table:
+            entry = _resolved[key] = table[cls]
+            return entry
+    raise KeyError(err_cls)
@@ -0,0 +1,32 @@
+"""
+Database session cleanup shared by the API and web error handlers.
+"""
+
+from __future__ import annotations
+
+from flask import g
+
+from app.extensions import db
+
+
+def rollback_session() -> None:
+    """
+    Roll back the request's database session after an error.
+
+    The rollback runs at most once per request: when several handlers fire
+    for the same failure (or a DB outage makes every request fail) the
+    repeated rollbacks would only contend for the session for no effect.
+    """
+    if g.get("_session_rolled_back"):
+        return
+
+    # Read-only failures (404s, auth errors) never open a transaction, so
+    # there is nothing to roll back
+    session = db.session
+    if session.in_transaction():
+        try:
+            session.rollback()
+        except Exception:
+            pass
+
+    g._session_rolled_back = True
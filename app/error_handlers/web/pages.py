@@ -0,0 +1,34 @@
+"""
+Cached rendering of the admin error page.
+
+errors_base.html only depends on the status code and message (plus static
+site info and URLs), so each (code, message) pair is rendered once per
+script root and the HTML is reused. The first request to hit a pair renders
+it, since the template builds URLs and needs a request context. This keeps
+error storms, e.g. a database outage, from paying for a Jinja render on
+every request.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from flask import render_template, request
+
+ERROR_TEMPLATE = "admin/base/errors_base.html"
+
+
+def render_error_page(error_code: int, error_message: str) -> bytes:
+    """
+    Render (or reuse) the error page for a code/message pair.
+
+    Returned already encoded, so handlers can hand the same bytes to every
+    response without Flask re-encoding the string each time.
+    """
+    # The page's links depend on where the app is mounted, so that is part of the key
+    return _render_error_page(error_code, error_message, request.script_root)
+
+
+@lru_cache(maxsize=64)
+def _render_error_page(error_code: int, error_message: str, script_root: str) -> bytes:
+    return render_template(ERROR_TEMPLATE, error_code=error_code, error_message=error_message).encode()
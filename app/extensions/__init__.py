@@ -24,7 +24,7 @@ mail = Mail()
 db = SQLAlchemy()
 migration = Migrate()
 jwt_extended = JWTManager()
-app_cache = Cache(config={'CACHE_TYPE': 'flask_caching.backends.SimpleCache'})
+app_cache = Cache()  # Backend comes from app.config (CACHE_TYPE / CACHE_REDIS_URL)
 
 
 def initialize_extensions(app: Flask):
@@ -36,4 +36,5 @@ def initialize_extensions(app: Flask):
     app_cache.init_app(app)
     migration.init_app(app, db=db)
 
-    cors.init_app(app=app, resources={r"/*": {"origins": Config.CORS_ORIGINS}}, supports_credentials=True)
+    # Only the API is called cross-origin; admin pages and static files skip CORS matching
+    cors.init_app(app=app, resources={r"/api/*": {"origins": Config.CORS_ORIGINS}}, supports_credentials=True)
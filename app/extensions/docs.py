@@ -41,11 +41,26 @@ config = DocsConfig.from_dict({
 config.use_response_wrapper = True
 
 
-# Create the OpenAPI spec instance with our configuration
-spec_instance = FlaskOpenAPISpec(config)
+# Built on first use rather than at import, so importing app.extensions (for
+# `db`, in scripts, shells and workers) doesn't construct the OpenAPI spec
+_spec_instance: FlaskOpenAPISpec | None = None
 
-# Expose the spec object for documentation utilities
-spec = spec_instance.spec
+
+def get_spec_instance() -> FlaskOpenAPISpec:
+    """Return the OpenAPI spec instance, creating it on first call."""
+    global _spec_instance
+    if _spec_instance is None:
+        _spec_instance = FlaskOpenAPISpec(config)
+    return _spec_instance
+
+
+def __getattr__(name: str):
+    # Keep `spec_instance` / `spec` importable without building them at import time
+    if name == "spec_instance":
+        return get_spec_instance()
+    if name == "spec":
+        return get_spec_instance().spec
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_docs(app: Flask) -> None:
@@ -55,4 +70,4 @@ def init_docs(app: Flask) -> None:
     Args:
         app: The Flask application instance to configure
     """
-    spec_instance.init_app(app)
+    get_spec_instance().init_app(app)
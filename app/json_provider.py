@@ -0,0 +1,66 @@
+import typing as t
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# orjson output is always compact, matching what Flask's response() asks for
+_COMPACT_SEPARATORS = (",", ":")
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson.
+
+    UUIDs and dataclasses are encoded natively, so models can hand raw values
+    to the response instead of calling `str()` per field. Datetimes, Decimals
+    and `__html__` objects still go through Flask's `default`, which keeps the
+    output identical to the stdlib provider.
+
+    `response()` always passes either compact `separators` or, in debug,
+    `indent=2`; both map onto orjson options. Any other keyword falls back
+    to `json`.
+    """
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        option = self._orjson_option(kwargs)
+        if option is None:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def _orjson_option(self, kwargs: dict[str, t.Any]) -> int | None:
+        """orjson flags equivalent to the `dumps` keywords, or None if only `json` supports them."""
+        if orjson is None:
+            return None
+
+        kwargs = dict(kwargs)
+        separators = kwargs.pop("separators", _COMPACT_SEPARATORS)
+        indent = kwargs.pop("indent", None)
+        if kwargs or tuple(separators) != _COMPACT_SEPARATORS or indent not in (None, 2):
+            return None
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def configure_json(app: Flask) -> None:
+    """
+    Use orjson for the app's JSON responses and request parsing.
+
+    Args:
+        app: The Flask application instance
+    """
+    app.json = ORJSONProvider(app)
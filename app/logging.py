@@ -1,21 +1,64 @@
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
-from flask import current_app, has_app_context, Flask
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
+from flask import Flask
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Attributes present on every LogRecord; anything else was passed via `extra`
+_RESERVED_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+_KNOWN_EXTRA_KEYS = ("event_type", "error_type", "message_text", "error_text", "data")
+# (record attribute, label) for the known extras, in DevFormatter output order
+_DEV_LABELS = (
+    ("event_type", "event_type"),
+    ("error_type", "error_type"),
+    ("message_text", "msg"),
+    ("error_text", "error"),
+    ("data", "data"),
+)
+_MISSING = object()
+# Immutable values that are safe to hand to the listener thread as they are
+_SNAPSHOT_SAFE_TYPES = (str, int, float, bool, type(None), uuid.UUID, date, datetime, Decimal)
+
+_listener: QueueListener | None = None
+# The configured app's logger, so log calls don't go through current_app's proxy
+_app_logger: logging.Logger | None = None
+
+
+def _structured_extras(record: logging.LogRecord) -> dict:
+    """Return the structured context attached to a record via `extra`."""
+    return {key: value for key, value in vars(record).items() if key not in _RESERVED_RECORD_ATTRS}
+
 
 def configure_logging(app: Flask) -> None:
     """
     Configure application logging.
 
     In production, use structured JSON logs. In other environments, use a
-    simple human-readable format.
+    simple human-readable format. Records are handed to a queue and written
+    by a background listener so formatting and stdout I/O happen off-request.
 
     Args:
         app: The Flask application instance
     """
+    global _listener, _app_logger
+
     if app.logger.hasHandlers():
         app.logger.handlers.clear()
 
+    if _listener is not None:
+        _listener.stop()
+
     handler = logging.StreamHandler(stream=sys.stdout)
 
     if app.config.get("ENV") == "production":
@@ -25,8 +68,52 @@ def configure_logging(app: Flask) -> None:
             fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         ))
 
-    app.logger.addHandler(handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    app.logger.addHandler(_InProcessQueueHandler(log_queue))
     app.logger.setLevel(app.config.get("LOG_LEVEL", "INFO"))
+    _app_logger = app.logger
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records on interpreter shutdown."""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _snapshot(value: object) -> object:
+    """Copy `value` into plain data, replacing anything else with its repr."""
+    if isinstance(value, _SNAPSHOT_SAFE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_snapshot(item) for item in value]
+    return repr(value)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """Queue handler for a listener in the same process.
+
+    The record does not need to be pickled, so `exc_info` stays intact for the
+    real formatter. Everything else is snapshotted on the logging thread, like
+    the default `prepare` does for `msg`: the listener formats later, when ORM
+    objects passed as `data` may be expired, detached or owned by another
+    thread's session.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.args or not isinstance(record.msg, str):
+            record.msg = record.getMessage()
+            record.args = None
+        for key, value in _structured_extras(record).items():
+            if not isinstance(value, _SNAPSHOT_SAFE_TYPES):
+                setattr(record, key, _snapshot(value))
+        return record
 
 
 class JsonFormatter(logging.Formatter):
@@ -47,18 +134,22 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        # Attach any extra context if provided
-        for key in ("event_type", "error_type", "message_text", "error_text", "data"):
-            if hasattr(record, key):
-                value = getattr(record, key)
-                # Ensure JSON serializable for complex objects
-                try:
-                    json.dumps(value)
-                    log_entry[key] = value
-                except Exception:
-                    log_entry[key] = repr(value)
+        # Attach any extra context if provided; values the encoder can't
+        # handle fall back to their repr during the single dumps below
+        log_entry.update(_structured_extras(record))
+
+        return _dumps(log_entry)
 
-        return json.dumps(log_entry)
+
+def _dumps(obj: object) -> str:
+    """Serialize to JSON in one pass, using orjson's C encoder when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=repr, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which orjson rejects outright
+            pass
+    return json.dumps(obj, default=repr)
 
 
 def log_event(message: str | None = None, data: object | None = None, event_type: str | None = None, **kwargs) -> None:
@@ -74,7 +165,11 @@ def log_event(message: str | None = None, data: object | None = None, event_type
     fields are added under extras so they are separately visible in JSON and
     in dev output.
     """
-    logger = current_app.logger if has_app_context() else logging.getLogger(__name__)
+    logger = _app_logger or logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.INFO):
+        # Filtered out anyway; skip building the text and extras
+        return
+
     if event_type is None:
         event_type = "event"
 
@@ -100,7 +195,9 @@ def log_error(message: str | None = None, error: Exception | str | None = None,
 
     If an Exception is provided and exc_info is not set, a traceback is attached.
     """
-    logger = current_app.logger if has_app_context() else logging.getLogger(__name__)
+    logger = _app_logger or logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.ERROR):
+        return
 
     # Determine error type/category
     derived_error_type = error.__class__.__name__ if isinstance(error, BaseException) else None
@@ -141,14 +238,12 @@ class DevFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401
         base = super().format(record)
         parts: list[str] = []
-        if hasattr(record, "event_type"):
-            parts.append(f"event_type={getattr(record, 'event_type')}")
-        if hasattr(record, "error_type"):
-            parts.append(f"error_type={getattr(record, 'error_type')}")
-        if hasattr(record, "message_text"):
-            parts.append(f"msg={getattr(record, 'message_text')}")
-        if hasattr(record, "error_text"):
-            parts.append(f"error={getattr(record, 'error_text')}")
-        if hasattr(record, "data"):
-            parts.append(f"data={getattr(record, 'data')}")
+        append = parts.append
+        for key, label in _DEV_LABELS:
+            value = getattr(record, key, _MISSING)
+            if value is not _MISSING:
+                append(f"{label}={value}")
+        for key, value in _structured_extras(record).items():
+            if key not in _KNOWN_EXTRA_KEYS:
+                append(f"{key}={value}")
         return base + (" | " + " ".join(parts) if parts else "")
\ No newline at end of file
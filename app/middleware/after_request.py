@@ -1,5 +1,5 @@
 import time
-from flask import Flask, request, Response
+from flask import Flask, current_app, request, Response
 from typing import Any, cast
 
 from app.logging import log_event
@@ -39,7 +39,8 @@ def add_security_headers(response: Response) -> Response:
 def log_response(response: Response) -> Response:
     """
     Function to log details about the response.
-    Logs the response status and response time.
+    Logs the response status and response time of error responses (4xx/5xx),
+    and of every response in debug mode.
     
     Args:
         response (Response): The response object.
@@ -47,15 +48,24 @@ def log_response(response: Response) -> Response:
     Returns:
         Response: The modified response object.
     """
+    # Successful responses are high-volume noise outside debug; only log failures
+    if response.status_code < 400 and not current_app.debug:
+        return response
+    
     context = cast(dict[str, Any], getattr(request, 'context', {}))
-    response_time = time.time() - context.get('start_time', time.time())
-    log_event("Response INFO", data=f"Response Status: {response.status}, \nResponse Time: {response_time}")
+    start_time = context.get('start_time')
+    if start_time is None:
+        # setup_resources didn't run (request failed before it); nothing to time
+        return response
+    
+    response_time_ms = (time.monotonic_ns() - start_time) // 1_000_000
+    log_event("Response INFO", status=response.status_code, response_time_ms=response_time_ms)
     return response
 
 def close_resources(response: Response) -> Response:
     """
     Function to close resources after each request.
-    Closes the database session.
+    Closes and discards the request's database session, if one was created.
     
     Args:
         response (Response): The response object.
@@ -63,5 +73,7 @@ def close_resources(response: Response) -> Response:
     Returns:
         Response: The modified response object.
     """
-    db.session.close()
+    # remove() is a no-op when nothing touched db.session (static files, health
+    # checks), whereas close() would first create a session just to close it
+    db.session.remove()
     return response
@@ -1,9 +1,10 @@
 import time
-from flask import request, abort, current_app
+from flask import request, abort, current_app, g
 from typing import Any, cast
 
 from app.logging import log_event
 from quas_utils.api import error_response
+from app.utils.helpers.routing import classify_path
 
 
 
@@ -12,7 +13,7 @@ def log_request() -> None:
     Function to log details about the incoming request.
     Logs the request path, method, and headers.
     """
-    log_event("Request INFO", f"Request Path: {request.path}, \nMethod: {request.method}, \nHeaders: {request.headers}")
+    log_event("Request INFO", path=request.path, method=request.method, headers=dict(request.headers))
 
 
 def json_check() -> None:
@@ -27,8 +28,10 @@ def json_check() -> None:
 def setup_resources() -> None:
     """
     Function to set up resources before each request.
-    Initializes a context dictionary with the start time.
+    Initializes a context dictionary with the start time and tags the
+    request's route class (api/admin/web) for error handlers.
     """
     setattr(request, 'context', {})
     context = cast(dict[str, Any], getattr(request, 'context'))
-    context['start_time'] = time.time()
+    context['start_time'] = time.monotonic_ns()
+    g.route_class = classify_path(request.path)
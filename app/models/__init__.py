@@ -8,8 +8,11 @@ Link: https://github.com/zeddyemy
 Copyright: © 2024 Emmanuel Olowu <zeddyemy@gmail.com>
 """
 from flask import Flask
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import aliased
 
+from ..extensions import db
+
 from .user import AppUser, Profile, Address, TempUser
 from .role import Role, UserRole
 from .media import Media
@@ -26,4 +29,12 @@ from .loyalty import LoyaltyAccount, LoyaltyLedger
 from .cms import CmsPage, B2BInquiry
 from .audit import AuditLog
 from .revamp import RevampRequest
-from .waitlist import WaitlistEntry
\ No newline at end of file
+from .waitlist import WaitlistEntry
+
+
+# Trigram (gin_trgm_ops) search indexes need pg_trgm before any table is created
+event.listen(
+    db.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
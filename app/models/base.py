@@ -2,6 +2,7 @@
 Base model with common functionality.
 """
 from datetime import datetime
+from typing import Any, Callable, Dict, Optional
 from flask_sqlalchemy import Model
 from sqlalchemy import Column, Integer, DateTime, func
 from sqlalchemy.orm import Mapped as M, DynamicMapped as DM  # type: ignore
@@ -11,6 +12,104 @@ import uuid
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
 from ..extensions import db
 
+# (output key, converter) pairs; the key is also the attribute read, and a
+# converter of None means the value is used as-is
+SerializeSpec = tuple[tuple[str, Optional[Callable[[Any], Any]]], ...]
+
+
+def str_or_none(value: Any) -> Optional[str]:
+    """``str(value)``, or None for empty values such as a null foreign key."""
+    return str(value) if value else None
+
+
+def iso_or_none(value: Optional[datetime]) -> Optional[str]:
+    """ISO-8601 string for a datetime, or None."""
+    return value.isoformat() if value else None
+
+
+def str_or_empty(value: Optional[str]) -> str:
+    """The value of a nullable text column, or ``""`` when it is unset."""
+    return value or ""
+
+
+def dict_or_empty(value: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The value of a JSON column, or ``{}`` when it is unset."""
+    return value or {}
+
+
+class IdStrMixin:
+    """
+    Provides `id_str`, the primary key as a string, computed once per instance.
+    
+    `str(uuid)` is pure Python and shows up in list serialization; the id never
+    changes once assigned, so the result is kept in the instance `__dict__`.
+    """
+    
+    @property
+    def id_str(self) -> Optional[str]:
+        id_str = self.__dict__.get("_id_str")
+        if id_str is None:
+            row_id = self.id  # type: ignore[attr-defined]
+            if row_id is None:  # not flushed yet
+                return None
+            id_str = self.__dict__["_id_str"] = str(row_id)
+        return id_str
+
+
+def _build_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a `to_dict` function for `cls` from its `__serialize_spec__`.
+    
+    The body is a single dict literal reading each attribute directly, e.g.
+    ``return {"id": _convert_0(self.id), "slug": self.slug}``, so calls pay
+    no per-field loop or getattr dispatch.
+    """
+    namespace: Dict[str, Any] = {}
+    fields: list[str] = []
+    for index, (name, convert) in enumerate(cls.__serialize_spec__):
+        if not name.isidentifier():
+            raise ValueError(f"{cls.__name__}.__serialize_spec__: invalid field name {name!r}")
+        value = f"self.{name}"
+        if name == "id" and convert is str:
+            value, convert = "self.id_str", None
+        if convert is not None:
+            namespace[f"_convert_{index}"] = convert
+            value = f"_convert_{index}({value})"
+        fields.append(f"        {name!r}: {value},")
+    
+    source = "def to_dict(self):\n    return {\n" + "\n".join(fields) + "\n    }\n"
+    exec(source, namespace)
+    
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__module__ = cls.__module__
+    to_dict.__doc__ = f"Convert {cls.__name__} to a dictionary (generated from __serialize_spec__)."
+    return to_dict
+
+
+class SerializableMixin(IdStrMixin):
+    """
+    Provides `to_dict` from a field list declared once on the class.
+    
+    Models set `__serialize_spec__` instead of hand-writing a dict literal. A
+    matching `to_dict` is generated once when the class is defined; models
+    that define their own `to_dict` can still build on it via `super().to_dict()`.
+    """
+    
+    __serialize_spec__: SerializeSpec = ()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "__serialize_spec__" in cls.__dict__:
+            generated = _build_to_dict(cls)
+            cls._spec_to_dict = generated  # type: ignore[attr-defined]
+            if "to_dict" not in cls.__dict__:
+                cls.to_dict = generated  # type: ignore[method-assign]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the model to a dictionary following `__serialize_spec__`."""
+        return self._spec_to_dict()  # type: ignore[attr-defined]
+
 
 class BaseModel(Model):
     """Base model with common fields and methods."""
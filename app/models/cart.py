@@ -7,19 +7,22 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy.orm import Mapped as M, relationship
+from decimal import Decimal
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Mapped as M, Session, relationship, selectinload
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
 from ..extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
+from .base import IdStrMixin
+from .product import Product, ProductVariant
 
 if TYPE_CHECKING:
     from .user import AppUser
-    from .product import ProductVariant
 
 
-class Cart(db.Model):
+class Cart(IdStrMixin, db.Model):
     """
     Cart model for storing shopping carts.
     
@@ -30,12 +33,19 @@ class Cart(db.Model):
     
     id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id: M[Optional[uuid.UUID]] = db.Column(UUID(as_uuid=True), db.ForeignKey("app_user.id", ondelete="CASCADE"), nullable=True, index=True)
-    guest_token: M[Optional[str]] = db.Column(db.String(255), nullable=True, unique=True, index=True)
+    guest_token: M[Optional[str]] = db.Column(db.String(255), nullable=True)
     
     # Timestamps
     created_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, index=True)
     updated_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     
+    __table_args__ = (
+        # A user's most recently touched cart without a separate sort
+        db.Index("ix_cart_user_updated", user_id, updated_at.desc()),
+        # User carts have no token, so only guest carts are indexed (and kept unique)
+        db.Index("ix_cart_guest", guest_token, unique=True, postgresql_where=guest_token.isnot(None)),
+    )
+    
     # Relationships
     user = relationship("AppUser", backref="carts")
     items = relationship("CartItem", back_populates="cart", cascade="all, delete-orphan")
@@ -46,35 +56,98 @@ class Cart(db.Model):
     @property
     def total_items(self) -> int:
         """Get total number of items in cart."""
-        return sum(item.quantity for item in self.items)
+        return self.totals()[0]
     
     @property
     def subtotal(self) -> float:
         """Calculate cart subtotal."""
-        return sum(item.quantity * float(item.unit_price) for item in self.items)
+        return self.totals()[1]
+    
+    def totals(self) -> tuple[int, float]:
+        """
+        Item count and subtotal together.
+        
+        Loaded items are summed in a single pass; otherwise the totals come
+        from one SQL aggregate.
+        """
+        if "items" not in self.__dict__:
+            return self._item_totals()
+        
+        # Accumulate the exact Decimal prices and convert once at the end,
+        # rather than rounding each line through float
+        count, amount = 0, Decimal(0)
+        for item in self.items:
+            quantity = item.quantity
+            count += quantity
+            amount += quantity * item.unit_price
+        return count, float(amount)
+    
+    def _item_totals(self) -> tuple[int, float]:
+        """
+        Item count and subtotal computed in SQL, for when the items aren't loaded.
+        
+        Avoids loading every CartItem just to add them up. The result is kept
+        on the instance until a flush touches cart items (see `_reset_cart_totals`).
+        """
+        totals = self.__dict__.get("_totals")
+        if totals is None:
+            quantity, amount = db.session.execute(
+                select(
+                    func.coalesce(func.sum(CartItem.quantity), 0),
+                    func.coalesce(func.sum(CartItem.quantity * CartItem.unit_price), 0),
+                ).where(CartItem.cart_id == self.id)
+            ).one()
+            totals = self.__dict__["_totals"] = (int(quantity), float(amount))
+        return totals
+    
+    def _prefetch_variants(self) -> list[ProductVariant]:
+        """
+        Load every item's variant, with the relationships its serializer reads,
+        in a fixed number of queries instead of several per item.
+        
+        The loaded variants land in the session's identity map, so each
+        `item.variant` then resolves without SQL. Callers must hold on to the
+        returned list while serializing, as the identity map is weak-referencing.
+        """
+        variant_ids = {item.variant_id for item in self.items}
+        if not variant_ids:
+            return []
+        
+        return (
+            ProductVariant.query
+            .options(
+                selectinload(ProductVariant.inventory),
+                selectinload(ProductVariant.materials),
+                selectinload(ProductVariant.product).selectinload(Product.materials),
+            )
+            .filter(ProductVariant.id.in_(variant_ids))
+            .all()
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert cart to dictionary."""
+        variants_map = {variant.id: variant for variant in self._prefetch_variants()}
+        total_items, subtotal = self.totals()
         return {
-            "id": str(self.id),
+            "id": self.id_str,
             "user_id": str(self.user_id) if self.user_id else None,
             "guest_token": self.guest_token,
-            "items": [item.to_dict() for item in self.items],
-            "total_items": self.total_items,
-            "subtotal": self.subtotal,
+            "items": [item.to_dict(include_variant=True, variants_map=variants_map) for item in self.items],
+            "total_items": total_items,
+            "subtotal": subtotal,
             "created_at": to_gmt1_or_none(self.created_at),
             "updated_at": to_gmt1_or_none(self.updated_at),
         }
 
 
-class CartItem(db.Model):
+class CartItem(IdStrMixin, db.Model):
     """
     CartItem model representing a line item in a cart.
     """
     __tablename__ = "cart_item"
     
     id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    cart_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey("cart.id", ondelete="CASCADE"), nullable=False, index=True)
+    cart_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey("cart.id", ondelete="CASCADE"), nullable=False)
     variant_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey("product_variant.id", ondelete="CASCADE"), nullable=False, index=True)
     quantity: M[int] = db.Column(db.Integer, nullable=False, default=1)
     unit_price: M[float] = db.Column(db.Numeric(14, 2), nullable=False)  # Snapshot of price at add time
@@ -83,6 +156,12 @@ class CartItem(db.Model):
     created_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow)
     updated_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     
+    __table_args__ = (
+        # Serves both "items of a cart" and "this variant in this cart" lookups;
+        # replaces the single-column cart_id index
+        db.Index("ix_cart_item_cart_variant", cart_id, variant_id),
+    )
+    
     # Relationships
     cart = relationship("Cart", back_populates="items")
     variant = relationship("ProductVariant")
@@ -95,23 +174,44 @@ class CartItem(db.Model):
         """Calculate line item total."""
         return self.quantity * float(self.unit_price)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert cart item to dictionary."""
-        variant_data = None
-        if self.variant:
-            # Get variant data with images and product info
-            variant_dict = self.variant.to_dict(include_inventory=True, include_product_info=True)
-            variant_data = variant_dict
+    def to_dict(
+            self,
+            include_variant: bool = False,
+            variants_map: Optional[Dict[uuid.UUID, ProductVariant]] = None,
+        ) -> Dict[str, Any]:
+        """
+        Convert cart item to dictionary.
         
-        return {
-            "id": str(self.id),
+        Args:
+            include_variant: Whether to include the serialized variant (with
+                inventory and product info). Light callers leave it off and
+                skip the variant queries entirely.
+            variants_map: Preloaded variants by id, used instead of `self.variant`
+                when given (see `Cart.to_dict`).
+        """
+        data = {
+            "id": self.id_str,
             "cart_id": str(self.cart_id),
             "variant_id": str(self.variant_id),
-            "variant": variant_data,
             "quantity": self.quantity,
             "unit_price": float(self.unit_price),
             "line_total": self.line_total,
             "created_at": to_gmt1_or_none(self.created_at),
             "updated_at": to_gmt1_or_none(self.updated_at),
         }
+        
+        if include_variant:
+            variant = variants_map.get(self.variant_id) if variants_map is not None else self.variant
+            # Get variant data with images and product info
+            data["variant"] = variant.to_dict(include_inventory=True, include_product_info=True) if variant else None
+        
+        return data
+
 
+@event.listens_for(Session, "after_flush")
+def _reset_cart_totals(session: Session, flush_context) -> None:
+    """Drop SQL-computed cart totals once cart items have been written."""
+    if any(isinstance(obj, CartItem) for obj in (*session.new, *session.dirty, *session.deleted)):
+        for obj in session.identity_map.values():
+            if isinstance(obj, Cart):
+                obj.__dict__.pop("_totals", None)
@@ -13,10 +13,11 @@ import uuid
 
 from app.extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
+from .base import SerializableMixin
 from .media import Media
 from .product import Product, product_categories
 
-class ProductCategory(db.Model):
+class ProductCategory(SerializableMixin, db.Model):
     __tablename__ = "product_category"
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
@@ -29,6 +30,23 @@ class ProductCategory(db.Model):
     media_id = db.Column(UUID(as_uuid=True), db.ForeignKey("media.id", ondelete="CASCADE"), nullable=True)
     parent_id = db.Column(UUID(as_uuid=True), db.ForeignKey("product_category.id"), nullable=True)  
     children = db.relationship("ProductCategory", backref=backref("parent", remote_side=[id]), lazy=True)
+    # Listings that render thumbnails add joinedload(ProductCategory.media)
+    media = db.relationship("Media")
+    
+    __table_args__ = (
+        # Trigram indexes let add_search_filters' ILIKE '%term%' use an index scan
+        db.Index('ix_product_category_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        db.Index('ix_product_category_slug_trgm', 'slug', postgresql_using='gin', postgresql_ops={'slug': 'gin_trgm_ops'}),
+    )
+    
+    __serialize_spec__ = (
+        ("id", None),
+        ("name", None),
+        ("alias", None),
+        ("description", None),
+        ("slug", None),
+        ("parent_id", None),
+    )
     
         
     def __repr__(self):
@@ -65,7 +83,7 @@ class ProductCategory(db.Model):
         return category
     
     def get_thumbnail(self):
-        media: Media = Media.query.get(self.media_id)
+        media: Media | None = self.media
         return media.get_path() if media else None
     
     def insert(self):
@@ -86,14 +104,7 @@ class ProductCategory(db.Model):
             db.session.commit()
     
     def to_dict(self, include_children=False) -> dict[str, any]:
-        data = {
-            "id": self.id,
-            "name": self.name,
-            "alias": self.alias,
-            "description": self.description,
-            "slug": self.slug,
-            "parent_id": self.parent_id
-            }
+        data = super().to_dict()
         if include_children:
             data["children"] = [child.to_dict() for child in self.children]
         return data
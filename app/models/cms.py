@@ -4,17 +4,18 @@ CMS and B2B inquiry models.
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Optional
 from datetime import datetime
-from sqlalchemy.orm import Mapped as M
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped as M, deferred
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 import uuid
 
 from ..extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
+from .base import SerializableMixin
 
 
-class CmsPage(db.Model):
+class CmsPage(SerializableMixin, db.Model):
     """
     CMS page model for static content.
     """
@@ -23,7 +24,8 @@ class CmsPage(db.Model):
     id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     slug: M[str] = db.Column(db.String(255), nullable=False, unique=True, index=True)
     title: M[str] = db.Column(db.String(255), nullable=False)
-    content: M[str] = db.Column(db.Text, nullable=False)
+    # Deferred: only loaded when read or undeferred by a query that serializes it
+    content: M[str] = deferred(db.Column(db.Text, nullable=False))
     published: M[bool] = db.Column(db.Boolean, nullable=False, default=False)
     published_at: M[Optional[datetime]] = db.Column(db.DateTime(timezone=True), nullable=True)
     
@@ -31,24 +33,27 @@ class CmsPage(db.Model):
     created_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow)
     updated_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     
+    __table_args__ = (
+        # Public lookups only ever hit published pages
+        db.Index("ix_cms_published", slug, postgresql_where=published),
+    )
+    
+    __serialize_spec__ = (
+        ("id", str),
+        ("slug", None),
+        ("title", None),
+        ("content", None),
+        ("published", None),
+        ("published_at", to_gmt1_or_none),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<CmsPage {self.id}, Slug: {self.slug}, Title: {self.title}>"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert CMS page to dictionary."""
-        return {
-            "id": str(self.id),
-            "slug": self.slug,
-            "title": self.title,
-            "content": self.content,
-            "published": self.published,
-            "published_at": to_gmt1_or_none(self.published_at),
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
 
 
-class B2BInquiry(db.Model):
+class B2BInquiry(SerializableMixin, db.Model):
     """
     B2B wholesale inquiry model.
     """
@@ -62,34 +67,39 @@ class B2BInquiry(db.Model):
     phone: M[str] = db.Column(db.String(120), nullable=False)
     country: M[str] = db.Column(db.String(100), nullable=False)
     expected_volume: M[Optional[str]] = db.Column(db.String(100), nullable=True)
-    product_categories: M[Optional[str]] = db.Column(db.Text, nullable=True)  # JSON array as string
-    note: M[Optional[str]] = db.Column(db.Text, nullable=True)
+    product_categories: M[Optional[list[str]]] = deferred(db.Column(ARRAY(db.String(100)), nullable=True), group="b2b_text")
+    note: M[Optional[str]] = deferred(db.Column(db.Text, nullable=True), group="b2b_text")
     status: M[str] = db.Column(db.String(50), nullable=False, default="new")  # new, contacted, in_negotiation, closed
     
     # Timestamps
     created_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, index=True)
     updated_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     
+    __table_args__ = (
+        # The open-inquiry queue; closed inquiries stay out of this index
+        db.Index("ix_b2b_new", created_at, postgresql_where=status == "new"),
+        # Category-of-interest matches (product_categories @> ARRAY[...])
+        db.Index("ix_b2b_cats_gin", product_categories, postgresql_using="gin"),
+    )
+    
+    __serialize_spec__ = (
+        ("id", str),
+        ("business_name", None),
+        ("business_type", None),
+        ("contact_name", None),
+        ("email", None),
+        ("phone", None),
+        ("country", None),
+        ("expected_volume", None),
+        ("product_categories", None),
+        ("note", None),
+        ("status", None),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<B2BInquiry {self.id}, Business: {self.business_name}, Status: {self.status}>"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert B2B inquiry to dictionary."""
-        return {
-            "id": str(self.id),
-            "business_name": self.business_name,
-            "business_type": self.business_type,
-            "contact_name": self.contact_name,
-            "email": self.email,
-            "phone": self.phone,
-            "country": self.country,
-            "expected_volume": self.expected_volume,
-            "product_categories": self.product_categories,
-            "note": self.note,
-            "status": self.status,
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
 
 
 
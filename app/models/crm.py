@@ -4,7 +4,7 @@ CRM staff and rating models.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime
 from sqlalchemy.orm import Mapped as M, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -12,13 +12,14 @@ import uuid
 
 from ..extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
+from .base import SerializableMixin, str_or_none
 
 if TYPE_CHECKING:
     from .user import AppUser
     from .order import Order
 
 
-class CrmStaff(db.Model):
+class CrmStaff(SerializableMixin, db.Model):
     """
     CRM staff model for tracking packaging and customer service staff.
     """
@@ -38,23 +39,21 @@ class CrmStaff(db.Model):
     packed_orders = relationship('Order', backref='packed_by_staff', foreign_keys='Order.packed_by_crm_id')
     ratings = relationship('CrmRating', back_populates='crm_staff')
     
+    __serialize_spec__ = (
+        ("id", str),
+        ("name", None),
+        ("staff_code", None),
+        ("contact", None),
+        ("role", None),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<CrmStaff {self.id}, Code: {self.staff_code}, Name: {self.name}>"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert CRM staff to dictionary."""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "staff_code": self.staff_code,
-            "contact": self.contact,
-            "role": self.role,
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
-
-
-class CrmRating(db.Model):
+
+
+class CrmRating(SerializableMixin, db.Model):
     """
     CRM rating model for customer ratings of staff.
     """
@@ -75,20 +74,18 @@ class CrmRating(db.Model):
     crm_staff = relationship('CrmStaff', back_populates='ratings')
     user = relationship('AppUser', backref='crm_ratings')
     
+    __serialize_spec__ = (
+        ("id", str),
+        ("order_id", str),
+        ("crm_staff_id", str),
+        ("user_id", str_or_none),
+        ("stars", None),
+        ("comment", None),
+        ("created_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<CrmRating {self.id}, Order: {self.order_id}, Stars: {self.stars}>"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert rating to dictionary."""
-        return {
-            "id": str(self.id),
-            "order_id": str(self.order_id),
-            "crm_staff_id": str(self.crm_staff_id),
-            "user_id": str(self.user_id) if self.user_id else None,
-            "stars": self.stars,
-            "comment": self.comment,
-            "created_at": to_gmt1_or_none(self.created_at),
-        }
 
 
 
@@ -4,15 +4,16 @@ Loyalty program models for House of Kezura Club.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterator, Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Enum as SQLEnum, select
 from sqlalchemy.orm import Mapped as M, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
 from ..extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
+from .base import SerializableMixin, str_or_none
 
 if TYPE_CHECKING:
     from .user import AppUser
@@ -31,7 +32,7 @@ LEDGER_TYPE_ADJUST = "adjust"
 LEDGER_TYPE_EXPIRE = "expire"
 
 
-class LoyaltyAccount(db.Model):
+class LoyaltyAccount(SerializableMixin, db.Model):
     """
     Loyalty account model for House of Kezura Club.
     """
@@ -51,23 +52,21 @@ class LoyaltyAccount(db.Model):
     user = relationship('AppUser', backref='loyalty_account')
     ledger_entries = relationship('LoyaltyLedger', back_populates='account', cascade='all, delete-orphan')
     
+    __serialize_spec__ = (
+        ("id", str),
+        ("user_id", str),
+        ("tier", None),
+        ("points_balance", None),
+        ("lifetime_spend", float),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<LoyaltyAccount {self.id}, User: {self.user_id}, Tier: {self.tier}, Points: {self.points_balance}>"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert loyalty account to dictionary."""
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "tier": self.tier,
-            "points_balance": self.points_balance,
-            "lifetime_spend": float(self.lifetime_spend),
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
 
 
-class LoyaltyLedger(db.Model):
+class LoyaltyLedger(SerializableMixin, db.Model):
     """
     Loyalty ledger model for tracking points transactions.
     """
@@ -82,7 +81,7 @@ class LoyaltyLedger(db.Model):
     ref_type: M[Optional[str]] = db.Column(db.String(50), nullable=True)  # order, campaign, manual, etc.
     
     # Expiry tracking
-    expires_at: M[Optional[datetime]] = db.Column(db.DateTime(timezone=True), nullable=True, index=True)
+    expires_at: M[Optional[datetime]] = db.Column(db.DateTime(timezone=True), nullable=True)
     
     # Timestamps
     created_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, index=True)
@@ -90,20 +89,41 @@ class LoyaltyLedger(db.Model):
     # Relationships
     account = relationship('LoyaltyAccount', back_populates='ledger_entries')
     
+    __table_args__ = (
+        # Most entries never expire; only those that do are indexed for expiry sweeps.
+        # now() isn't IMMUTABLE, so it can't go in the predicate — filter on it at query time.
+        db.Index("ix_loyalty_unexpired", account_id, expires_at, postgresql_where=expires_at.isnot(None)),
+    )
+    
+    __serialize_spec__ = (
+        ("id", str),
+        ("account_id", str),
+        ("type", None),
+        ("points", None),
+        ("reason", None),
+        ("ref_id", str_or_none),
+        ("ref_type", None),
+        ("expires_at", to_gmt1_or_none),
+        ("created_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<LoyaltyLedger {self.id}, Account: {self.account_id}, Type: {self.type}, Points: {self.points}>"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert ledger entry to dictionary."""
-        return {
-            "id": str(self.id),
-            "account_id": str(self.account_id),
-            "type": self.type,
-            "points": self.points,
-            "reason": self.reason,
-            "ref_id": str(self.ref_id) if self.ref_id else None,
-            "ref_type": self.ref_type,
-            "expires_at": to_gmt1_or_none(self.expires_at),
-            "created_at": to_gmt1_or_none(self.created_at),
-        }
+    @staticmethod
+    def stream_for_account(account_id: uuid.UUID, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield an account's ledger entries as dicts, newest first.
+        
+        Rows are fetched `batch_size` at a time (``yield_per``), so exporting a
+        long history holds one batch in memory instead of the whole ledger.
+        """
+        result = db.session.execute(
+            select(LoyaltyLedger)
+            .where(LoyaltyLedger.account_id == account_id)
+            .order_by(LoyaltyLedger.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        for entry in result.scalars():
+            yield entry.to_dict()
 
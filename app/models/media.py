@@ -13,16 +13,18 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import UUID, ForeignKey
+from sqlalchemy import UUID, ForeignKey, text, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped as M, relationship
 
 from app.extensions import db
 from quas_utils.date_time import QuasDateTime
+from .base import SerializableMixin, iso_or_none
 
 
-class Media(db.Model):
+class Media(SerializableMixin, db.Model):
     """Model for media files within Events."""
 
     __tablename__ = 'media'
@@ -53,7 +55,7 @@ class Media(db.Model):
     cloudinary_folder: M[str] = db.Column(db.String(200), nullable=False)
 
     # Optimization metadata
-    optimized_versions: M[Dict[str, str]] = db.Column(db.JSON, default=dict, comment="URLs for different optimized versions (thumbnail, medium, large)")
+    optimized_versions: M[Dict[str, str]] = db.Column(JSONB, default=dict, server_default=text("'{}'::jsonb"), comment="URLs for different optimized versions (thumbnail, medium, large)")
 
     # Usage tracking
     is_featured: M[bool] = db.Column(db.Boolean(), default=False)
@@ -65,34 +67,42 @@ class Media(db.Model):
 
     # Relationships
 
+    __table_args__ = (
+        # jsonb_path_ops serves containment lookups (optimized_versions @> '{...}')
+        db.Index(
+            "ix_media_optimized_gin",
+            optimized_versions,
+            postgresql_using="gin",
+            postgresql_ops={"optimized_versions": "jsonb_path_ops"},
+        ),
+    )
+
+    __serialize_spec__ = (
+        ('id', str),
+        ('filename', None),
+        ('original_filename', None),
+        ('file_path', None),
+        ('file_url', None),
+        ('thumbnail_url', None),
+        ('file_size', None),
+        ('file_type', None),
+        ('mime_type', None),
+        ('file_extension', None),
+        ('width', None),
+        ('height', None),
+        ('duration', None),
+        ('cloudinary_public_id', None),
+        ('cloudinary_folder', None),
+        ('optimized_versions', None),
+        ('is_featured', None),
+        ('usage_count', None),
+        ('created_at', iso_or_none),
+        ('updated_at', iso_or_none),
+    )
+
     def __repr__(self) -> str:
         return f"<Media {self.id}, {self.filename} ({self.file_type})>"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert media instance to dictionary representation."""
-        return {
-            'id': str(self.id),
-            'filename': self.filename,
-            'original_filename': self.original_filename,
-            'file_path': self.file_path,
-            'file_url': self.file_url,
-            'thumbnail_url': self.thumbnail_url,
-            'file_size': self.file_size,
-            'file_type': self.file_type,
-            'mime_type': self.mime_type,
-            'file_extension': self.file_extension,
-            'width': self.width,
-            'height': self.height,
-            'duration': self.duration,
-            'cloudinary_public_id': self.cloudinary_public_id,
-            'cloudinary_folder': self.cloudinary_folder,
-            'optimized_versions': self.optimized_versions,
-            'is_featured': self.is_featured,
-            'usage_count': self.usage_count,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
-
     @property
     def aspect_ratio(self) -> Optional[float]:
         """Calculate aspect ratio if dimensions are available."""
@@ -105,15 +115,29 @@ class Media(db.Model):
         """Get file size in MB."""
         return self.file_size / (1024 * 1024)
 
-    def increment_usage(self) -> None:
-        """Increment usage count."""
-        self.usage_count += 1
-        db.session.commit()
+    def increment_usage(self, commit: bool = True) -> None:
+        """
+        Increment usage count.
+
+        Done as an atomic ``usage_count = usage_count + 1`` in SQL so concurrent
+        requests don't overwrite each other's increments.
+        """
+        db.session.execute(
+            update(Media)
+            .where(Media.id == self.id)
+            .values(usage_count=Media.usage_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        # Reload the real value on next access rather than guessing it locally
+        db.session.expire(self, ["usage_count"])
+        if commit:
+            db.session.commit()
 
-    def mark_featured(self, featured: bool = True) -> None:
+    def mark_featured(self, featured: bool = True, commit: bool = True) -> None:
         """Mark or un-mark media as featured."""
         self.is_featured = featured
-        db.session.commit()
+        if commit:
+            db.session.commit()
 
     def get_path(self) -> str:
         """Get the public URL path for the media file."""
@@ -4,19 +4,35 @@ from datetime import datetime
 import secrets
 import string
 
-from sqlalchemy.orm import Mapped as M, relationship  # type: ignore
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import insert
+from sqlalchemy.orm import Mapped as M, deferred, relationship  # type: ignore
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
 from ..extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
 from ..enums.orders import OrderStatus
+from .base import SerializableMixin, dict_or_empty
 
 if TYPE_CHECKING:
     from .user import AppUser
 
+# Uppercase letters and digits, excluding ambiguous characters (0, O, I, L, 1)
+ORDER_NUMBER_ALPHABET = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
+ORDER_NUMBER_PREFIX = "KEZ-"
 
-class Order(db.Model):
+# Maps a random byte straight to an alphabet character. Only bytes below the
+# largest multiple of the alphabet size (248 for 31) are kept, so every
+# character stays equally likely; the rest are deleted and redrawn.
+_ORDER_NUMBER_CUTOFF = 256 - 256 % len(ORDER_NUMBER_ALPHABET)
+_ORDER_NUMBER_TABLE = bytes(
+    ord(ORDER_NUMBER_ALPHABET[b % len(ORDER_NUMBER_ALPHABET)]) if b < _ORDER_NUMBER_CUTOFF else 0
+    for b in range(256)
+)
+_ORDER_NUMBER_REJECTED = bytes(range(_ORDER_NUMBER_CUTOFF, 256))
+
+
+class Order(SerializableMixin, db.Model):
     """
     E-commerce order model.
     Supports both authenticated users and guest orders.
@@ -47,46 +63,34 @@ class Order(db.Model):
     
     # Payment
     payment_ref: M[Optional[str]] = db.Column(db.String(255), nullable=True)
-    payment_url: M[Optional[str]] = db.Column(db.Text, nullable=True)  # Store authorization_url for re-completing payment
+    payment_url: M[Optional[str]] = deferred(db.Column(db.Text, nullable=True), group="order_detail")  # Store authorization_url for re-completing payment
     
     @staticmethod
-    def generate_order_number(max_attempts: int = 10) -> str:
+    def generate_order_number() -> str:
         """
-        Generate a unique, human-readable order number.
+        Generate a candidate human-readable order number.
         
-        Format: KEZ-XXXXXXXX (8 uppercase alphanumeric characters after prefix).
-        Uses cryptographically secure random generation and checks database
-        for collisions, retrying up to max_attempts times.
+        Format: KEZ-XXXXXXXX (8 uppercase alphanumeric characters after prefix),
+        using cryptographically secure random generation. One `token_bytes`
+        draw is mapped to characters with `bytes.translate` rather than eight
+        separate `secrets.choice` calls.
         
-        Args:
-            max_attempts: Maximum number of generation attempts before raising an error.
+        No query is made: with 31^8 possible values a collision is vanishingly
+        rare, so callers rely on the unique index on `order_number` and retry
+        with a fresh candidate if the insert raises IntegrityError.
         
         Returns:
-            A unique order number string (e.g., 'KEZ-A7B3C9D2').
-        
-        Raises:
-            RuntimeError: If unable to generate a unique number after max_attempts.
+            An order number string (e.g., 'KEZ-A7B3C9D2').
         """
-        # Use only uppercase letters and digits, excluding ambiguous characters (0, O, I, L, 1)
-        alphabet = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
-        prefix = "KEZ-"
-        
-        for _ in range(max_attempts):
-            random_part = ''.join(secrets.choice(alphabet) for _ in range(8))
-            candidate = f"{prefix}{random_part}"
-            
-            # Check if this order number already exists
-            existing = Order.query.filter_by(order_number=candidate).first()
-            if existing is None:
-                return candidate
-        
-        raise RuntimeError(
-            f"Failed to generate unique order number after {max_attempts} attempts. "
-            "This indicates an extremely unlikely collision scenario or database issue."
-        )
+        while True:
+            # 12 bytes leave room for the ~3% of bytes rejected above
+            chars = secrets.token_bytes(12).translate(_ORDER_NUMBER_TABLE, _ORDER_NUMBER_REJECTED)
+            if len(chars) >= 8:
+                return ORDER_NUMBER_PREFIX + chars[:8].decode()
     
-    # Shipping address snapshot (stored as JSON for guest orders)
-    shipping_address: M[Dict[str, Any]] = db.Column(JSON, nullable=True)
+    # Shipping address snapshot (stored as JSONB for guest orders)
+    # Deferred with payment_url: only loaded when read, or undeferred by queries that serialize orders
+    shipping_address: M[Dict[str, Any]] = deferred(db.Column(JSONB, nullable=True), group="order_detail")
     
     # CRM staff tracking
     packed_by_crm_id: M[Optional[uuid.UUID]] = db.Column(UUID(as_uuid=True), db.ForeignKey('crm_staff.id'), nullable=True)
@@ -104,18 +108,39 @@ class Order(db.Model):
     items = relationship('OrderItem', back_populates='order', cascade='all, delete-orphan')
     shipments = relationship('Shipment', back_populates='order', cascade='all, delete-orphan')
 
+    __serialize_spec__ = (
+        ('id', None),
+        ('order_number', None),
+        ('status', str),
+        ('subtotal', float),
+        ('shipping_cost', float),
+        ('discount', float),
+        ('points_redeemed', None),
+        ('total', float),
+        ('amount', float),  # Legacy field
+        ('currency', None),
+        ('payment_ref', None),
+        ('payment_url', None),
+        ('shipping_address', dict_or_empty),
+        ('packed_by_crm_id', None),
+        ('guest_email', None),
+        ('guest_phone', None),
+        ('created_at', to_gmt1_or_none),
+        ('updated_at', to_gmt1_or_none),
+    )
+
     def __repr__(self):
         return f'<Order ID: {self.id}, Status: {self.status}, Total: {self.total}>'
 
-    def update(self, commit=True, **kwargs):
-        """Update order attributes."""
+    def update(self, commit=False, **kwargs):
+        """Update order attributes. The caller commits unless `commit=True`."""
         for key, value in kwargs.items():
             setattr(self, key, value)
         if commit:
             db.session.commit()
 
-    def delete(self, commit=True):
-        """Delete the order."""
+    def delete(self, commit=False):
+        """Delete the order. The caller commits unless `commit=True`."""
         db.session.delete(self)
         if commit:
             db.session.commit()
@@ -128,29 +153,11 @@ class Order(db.Model):
             user: Whether to include full user info
             include_items: Whether to include order items
         """
-        user_info = {'user': self.app_user.to_dict()} if user and self.app_user else {'user_id': str(self.user_id) if self.user_id else None}
-        
-        data = {
-            'id': str(self.id),
-            'order_number': self.order_number,
-            'status': str(self.status),
-            'subtotal': float(self.subtotal),
-            'shipping_cost': float(self.shipping_cost),
-            'discount': float(self.discount),
-            'points_redeemed': self.points_redeemed,
-            'total': float(self.total),
-            'amount': float(self.amount),  # Legacy field
-            'currency': self.currency,
-            'payment_ref': self.payment_ref,
-            'payment_url': self.payment_url,
-            'shipping_address': self.shipping_address or {},
-            'packed_by_crm_id': str(self.packed_by_crm_id) if self.packed_by_crm_id else None,
-            'guest_email': self.guest_email,
-            'guest_phone': self.guest_phone,
-            'created_at': to_gmt1_or_none(self.created_at),
-            'updated_at': to_gmt1_or_none(self.updated_at),
-            **user_info,
-        }
+        data = self._spec_to_dict()
+        if user and self.app_user:
+            data['user'] = self.app_user.to_dict()
+        else:
+            data['user_id'] = self.user_id
         
         if include_items:
             data['items'] = [item.to_dict() for item in self.items]
@@ -158,14 +165,14 @@ class Order(db.Model):
         return data
 
 
-class OrderItem(db.Model):
+class OrderItem(SerializableMixin, db.Model):
     """
     Order item model representing a line item in an order.
     """
     __tablename__ = "order_item"
     
     id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    order_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey('order.id', ondelete='CASCADE'), nullable=False, index=True)
+    order_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey('order.id', ondelete='CASCADE'), nullable=False)
     variant_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey('product_variant.id'), nullable=False, index=True)
     quantity: M[int] = db.Column(db.Integer, nullable=False)
     unit_price: M[float] = db.Column(db.Numeric(14, 2), nullable=False)  # Snapshot of price at order time
@@ -173,10 +180,24 @@ class OrderItem(db.Model):
     # Timestamps
     created_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow)
     
+    __table_args__ = (
+        # An order's items in creation order as a range scan; also serves order_id-only lookups
+        db.Index('ix_order_item_order_id_created_at', order_id, created_at),
+    )
+    
     # Relationships
     order = relationship('Order', back_populates='items')
     variant = relationship('ProductVariant')
     
+    __serialize_spec__ = (
+        ("id", None),
+        ("order_id", None),
+        ("variant_id", None),
+        ("quantity", None),
+        ("unit_price", float),
+        ("created_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self):
         return f'<OrderItem {self.id}, Order: {self.order_id}, Variant: {self.variant_id}, Qty: {self.quantity}>'
     
@@ -185,31 +206,38 @@ class OrderItem(db.Model):
         """Calculate line item total."""
         return self.quantity * float(self.unit_price)
     
+    @classmethod
+    def bulk_insert(cls, order_id: uuid.UUID, rows: list[dict]) -> None:
+        """
+        Insert an order's line items in one multi-row INSERT.
+        
+        Args:
+            order_id: Order the items belong to
+            rows: Dicts with ``variant_id``, ``quantity`` and ``unit_price``
+        """
+        if rows:
+            db.session.execute(insert(cls), [{"order_id": order_id, **row} for row in rows])
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert order item to dictionary."""
         variant_data = None
         if self.variant:
             variant_data = {
-                "id": str(self.variant.id),
+                "id": self.variant.id,
                 "sku": self.variant.sku,
-                "product_id": str(self.variant.product_id),
+                "product_id": self.variant.product_id,
                 "attributes": self.variant.attributes or {},
-                "image_urls": [img.file_url for img in self.variant.images.all()] if self.variant.images else [],
+                "image_urls": [img.file_url for img in self.variant.images],
             }
         
-        return {
-            "id": str(self.id),
-            "order_id": str(self.order_id),
-            "variant_id": str(self.variant_id),
-            "variant": variant_data,
-            "quantity": self.quantity,
-            "unit_price": float(self.unit_price),
-            "line_total": self.line_total,
-            "created_at": to_gmt1_or_none(self.created_at),
-        }
-
-
-class Shipment(db.Model):
+        data = self._spec_to_dict()
+        data["variant"] = variant_data
+        # Same as line_total, from the already-converted price
+        data["line_total"] = data["quantity"] * data["unit_price"]
+        return data
+
+
+class Shipment(SerializableMixin, db.Model):
     """
     Shipment model for tracking order shipments.
     """
@@ -229,20 +257,18 @@ class Shipment(db.Model):
     # Relationships
     order = relationship('Order', back_populates='shipments')
     
+    __serialize_spec__ = (
+        ("id", None),
+        ("order_id", None),
+        ("courier", None),
+        ("tracking_number", None),
+        ("status", None),
+        ("estimated_delivery", to_gmt1_or_none),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self):
         return f'<Shipment {self.id}, Order: {self.order_id}, Tracking: {self.tracking_number}>'
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert shipment to dictionary."""
-        return {
-            "id": str(self.id),
-            "order_id": str(self.order_id),
-            "courier": self.courier,
-            "tracking_number": self.tracking_number,
-            "status": self.status,
-            "estimated_delivery": to_gmt1_or_none(self.estimated_delivery),
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
 
 
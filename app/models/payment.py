@@ -2,21 +2,23 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
 from enum import Enum
-from sqlalchemy.orm import Query, Mapped as M  # type: ignore
-from sqlalchemy.dialects.postgresql import UUID
+from functools import cached_property
+from sqlalchemy.orm import Query, Mapped as M, deferred  # type: ignore
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
 from ..extensions import db
 from quas_utils.misc import generate_random_string
 from quas_utils.date_time import QuasDateTime
-from ..utils.payments.rates import convert_amount
+from ..utils.payments.rates import convert_amount, fetch_exchange_rates
 from ..enums.payments import PaymentStatus, TransactionType
+from .base import SerializableMixin, dict_or_empty, iso_or_none
 
 if TYPE_CHECKING:
     from .user import AppUser
     from .subscription import Subscription
 
-class Payment(db.Model):
+class Payment(SerializableMixin, db.Model):
     """
     Model to represent a payment request made by a user in Folio Builder.
     This model captures details about a payment request before it is processed.
@@ -29,7 +31,7 @@ class Payment(db.Model):
     narration = db.Column(db.String(255), nullable=True)
     payment_method = db.Column(db.String(80), nullable=False)  # 'wallet' or 'payment gateway(flutterwave)'
     status = db.Column(db.String(20), nullable=False, default=str(PaymentStatus.PENDING))  # Status of the payment request
-    meta_info = db.Column(db.JSON, default=dict)  # Store payment type and related data
+    meta_info = db.Column(JSONB, default=dict)  # Store payment type and related data
     
     created_at = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow)
     updated_at = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
@@ -41,20 +43,29 @@ class Payment(db.Model):
     subscription_id = db.Column(UUID(as_uuid=True), db.ForeignKey('subscription.id'), nullable=True)
     subscription = db.relationship('Subscription', back_populates='payment')
     
+    # amount is converted per currency in to_dict, so it isn't part of the spec
+    __serialize_spec__ = (
+        ('id', None),
+        ('key', None),
+        ('narration', None),
+        ('payment_method', None),
+        ('status', None),
+        ('meta_info', dict_or_empty),
+        ('created_at', iso_or_none),
+        ('updated_at', iso_or_none),
+    )
+    
     def __repr__(self):
         return f'<ID: {self.id}, Amount: {self.amount}, Payment Method: {self.payment_method}>'
     
-    @property
+    @cached_property
     def currency_code(self):
-        # Prefer user's wallet if available; otherwise fall back to meta_info or default
-        if getattr(self, "app_user", None) and getattr(self.app_user, "wallet", None):
-            return self.app_user.wallet.currency_code
-        meta_currency = None
-        try:
-            meta_currency = (self.meta_info or {}).get("currency")
-        except Exception:
-            meta_currency = None
-        return meta_currency or "NGN"
+        # Prefer user's wallet if available; otherwise fall back to meta_info or default.
+        # Cached per instance: list serializers read it for every row.
+        app_user = self.app_user
+        if app_user is not None and app_user.wallet is not None:
+            return app_user.wallet.currency_code
+        return (self.meta_info or {}).get("currency") or "NGN"
     
     @classmethod
     def create_payment_record(cls, key, amount, payment_method, status, app_user, commit=True, **kwargs):
@@ -80,39 +91,41 @@ class Payment(db.Model):
         
         return payment_record
     
-    def update(self, commit=True, **kwargs):
+    def update(self, commit=False, **kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
         
         if commit:
             db.session.commit()
     
-    def delete(self, commit=True):
+    def delete(self, commit=False):
         db.session.delete(self)
         if commit:
             db.session.commit()
     
-    def to_dict(self, user: bool = False) -> dict:
-        user_info = {'user': self.app_user.to_dict()} if user else {'user_id': str(self.user_id)} # optionally include user info in dict
-        return {
-            'id': str(self.id),
-            'key': self.key,
-            'amount': convert_amount(self.amount, self.currency_code),
-            'narration': self.narration,
-            'payment_method': self.payment_method,
-            'status': self.status,
-            'meta_info': self.meta_info if self.meta_info else {},
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            **user_info,
-        }
+    @classmethod
+    def to_dict_bulk(cls, records: list, user: bool = False) -> list[dict]:
+        """Serialize many records, resolving the exchange-rate table once for all of them."""
+        exchange_rates = fetch_exchange_rates() or {}
+        return [record.to_dict(user=user, exchange_rates=exchange_rates) for record in records]
+    
+    def to_dict(self, user: bool = False, exchange_rates: Optional[dict] = None) -> dict:
+        data = self._spec_to_dict()
+        data['amount'] = convert_amount(self.amount, self.currency_code, exchange_rates=exchange_rates)
+        # optionally include user info in dict
+        if user:
+            data['user'] = self.app_user.to_dict()
+        else:
+            data['user_id'] = self.user_id
+        return data
 
 
-class Transaction(db.Model):
+class Transaction(SerializableMixin, db.Model):
     """
     Model to represent a financial transaction associated with a payment on the platform.
     This model captures details about the financial aspect of a payment or withdrawal.
     """
+    __tablename__ = "transaction"
     
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     key = db.Column(db.String(80), unique=True, nullable=False) # Unique identifier for the financial transaction
@@ -120,26 +133,33 @@ class Transaction(db.Model):
     transaction_type = db.Column(db.String(80), nullable=False) # 'credit', 'debit', 'payment' or 'withdraw'
     narration = db.Column(db.String(150), nullable=True)
     status = db.Column(db.String(80), nullable=False) # Status of the financial transaction
-    meta_info = db.Column(db.JSON, default=dict)  # Store addition info or related data
+    meta_info = deferred(db.Column(JSONB, default=dict))  # Store addition info or related data; deferred as it's rarely read
     
     created_at = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow)
     updated_at = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     
     # Relationship with the user model
-    user_id = db.Column(UUID(as_uuid=True), db.ForeignKey('app_user.id'), nullable=True)
-    user_id = db.Column(UUID(as_uuid=True), db.ForeignKey('app_user.id'), nullable=True)
+    user_id = db.Column(UUID(as_uuid=True), db.ForeignKey('app_user.id'), nullable=True, index=True)
     app_user = db.relationship('AppUser', backref=db.backref('transactions', lazy='dynamic'))
     
-    @property
+    # amount is converted per currency in to_dict, so it isn't part of the spec
+    __serialize_spec__ = (
+        ('id', None),
+        ('key', None),
+        ('transaction_type', str),
+        ('narration', None),
+        ('status', None),
+        ('created_at', None),
+        ('updated_at', None),
+    )
+    
+    @cached_property
     def currency_code(self):
-        if getattr(self, "app_user", None) and getattr(self.app_user, "wallet", None):
-            return self.app_user.wallet.currency_code
-        meta_currency = None
-        try:
-            meta_currency = (self.meta_info or {}).get("currency")
-        except Exception:
-            meta_currency = None
-        return meta_currency or "NGN"
+        # Same resolution (and per-instance caching) as Payment.currency_code
+        app_user = self.app_user
+        if app_user is not None and app_user.wallet is not None:
+            return app_user.wallet.currency_code
+        return (self.meta_info or {}).get("currency") or "NGN"
     
     def __repr__(self):
         return f'<ID: {self.id}, Transaction Reference: {self.key}, Transaction Type: {self.transaction_type}, Status: {self.status}>'
@@ -171,29 +191,25 @@ class Transaction(db.Model):
         
         return transaction
     
-    def update(self, commit=True, **kwargs):
+    def update(self, commit=False, **kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
         
         if commit:
             db.session.commit()
     
-    def delete(self, commit=True):
+    def delete(self, commit=False):
         db.session.delete(self)
         if commit:
             db.session.commit()
     
-    def to_dict(self, user: bool = False) -> dict:
-        user_info = {'user': self.app_user.to_dict(),} if user else {'user_id': self.user_id} # optionally include user info in dict
-        return {
-            'id': self.id,
-            'key': self.key,
-            'amount': convert_amount(self.amount, self.currency_code),
-            'transaction_type': str(self.transaction_type),
-            'narration': self.narration,
-            'status': self.status,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at,
-            **user_info,
-        }
+    def to_dict(self, user: bool = False, exchange_rates: Optional[dict] = None) -> dict:
+        data = self._spec_to_dict()
+        data['amount'] = convert_amount(self.amount, self.currency_code, exchange_rates=exchange_rates)
+        # optionally include user info in dict
+        if user:
+            data['user'] = self.app_user.to_dict()
+        else:
+            data['user_id'] = self.user_id
+        return data
 
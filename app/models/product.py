@@ -6,14 +6,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional, Dict, Any, cast
 from datetime import datetime
-from sqlalchemy import or_, and_, func
-from sqlalchemy.orm import Query, Mapped as M, relationship
+from sqlalchemy import or_, and_, func, distinct, select, text
+from sqlalchemy.orm import Query, Mapped as M, column_property, deferred, relationship, selectinload, raiseload, query_expression, with_expression
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, JSONB, TSVECTOR
 import uuid
 
 from app.extensions import db
 from quas_utils.date_time import QuasDateTime, to_gmt1_or_none
+from .base import SerializableMixin, dict_or_empty, str_or_empty
 from app.enums.products import (
     ProductCategory,
     HairType,
@@ -39,6 +40,8 @@ product_materials = db.Table(
     "product_materials",
     db.Column("product_id", UUID(as_uuid=True), db.ForeignKey("product.id", ondelete="CASCADE"), primary_key=True),
     db.Column("material_id", UUID(as_uuid=True), db.ForeignKey("product_material.id", ondelete="CASCADE"), primary_key=True),
+    # material_id isn't the leading primary key column; backs ProductMaterial.usage_count
+    db.Index("ix_product_materials_material_id", "material_id"),
 )
 
 # Association table for variant-material many-to-many relationship
@@ -46,6 +49,7 @@ variant_materials = db.Table(
     "variant_materials",
     db.Column("variant_id", UUID(as_uuid=True), db.ForeignKey("product_variant.id", ondelete="CASCADE"), primary_key=True),
     db.Column("material_id", UUID(as_uuid=True), db.ForeignKey("product_material.id", ondelete="CASCADE"), primary_key=True),
+    db.Index("ix_variant_materials_material_id", "material_id"),
 )
 
 # Association table for linked products (sets/pieces) - self-referential many-to-many
@@ -63,7 +67,7 @@ product_relations = db.Table(
 )
 
 
-class ProductMaterial(db.Model):
+class ProductMaterial(SerializableMixin, db.Model):
     """
     ProductMaterial model representing materials that can be used for products.
     Admins can create materials and link them to products.
@@ -83,33 +87,55 @@ class ProductMaterial(db.Model):
     # Relationship to variants (many-to-many via variant_materials)
     variants = relationship("ProductVariant", secondary="variant_materials", back_populates="materials")
     
+    # Count of products and variants using this material, selected with the
+    # row instead of loading both collections
+    usage_count: M[int] = column_property(
+        select(func.count())
+        .select_from(product_materials)
+        .where(product_materials.c.material_id == id)
+        .scalar_subquery()
+        + select(func.count())
+        .select_from(variant_materials)
+        .where(variant_materials.c.material_id == id)
+        .scalar_subquery()
+    )
+    
+    __serialize_spec__ = (
+        ("id", None),
+        ("name", None),
+        ("description", str_or_empty),
+        ("usage_count", None),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<ProductMaterial {self.id}, {self.name}>"
     
-    @property
-    def usage_count(self) -> int:
-        """Get the count of products and variants using this material."""
-        product_count = len(self.products) if self.products else 0
-        variant_count = len(self.variants) if self.variants else 0
-        return product_count + variant_count
+    @staticmethod
+    def to_dicts(materials: List["ProductMaterial"], cache: Optional[Dict[Any, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Serialize `materials`, reusing payloads already in `cache` (keyed by id)."""
+        if cache is None:
+            return [m.to_dict() for m in materials]
+        
+        result = []
+        for material in materials:
+            data = cache.get(material.id)
+            if data is None:
+                data = cache[material.id] = material.to_dict()
+            result.append(data)
+        return result
     
     def to_dict(self, include_products: bool = False) -> Dict[str, Any]:
         """Convert material to dictionary."""
-        data = {
-            "id": str(self.id),
-            "name": self.name,
-            "description": self.description or "",
-            "usage_count": self.usage_count,
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
+        data = self._spec_to_dict()
         
         if include_products:
-            data["products"] = [{"id": str(p.id), "name": p.name, "sku": p.sku} for p in self.products]
+            data["products"] = [{"id": p.id, "name": p.name, "sku": p.sku} for p in self.products]
         
         return data
 
-class Product(db.Model):
+class Product(SerializableMixin, db.Model):
     """
     Product model representing a base product (e.g., a wig style).
     Products have variants (different lengths, colors, etc.).
@@ -141,9 +167,32 @@ class Product(db.Model):
     updated_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     deleted_at: M[Optional[datetime]] = db.Column(db.DateTime(timezone=True), nullable=True)
     
+    # Full-text search document, maintained by PostgreSQL; only used in filters
+    search_vector = deferred(db.Column(
+        TSVECTOR,
+        db.Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(sku, '') || ' ' "
+            "|| coalesce(description, '') || ' ' || coalesce(slug, ''))",
+            persisted=True,
+        ),
+    ))
+    
+    __table_args__ = (
+        db.Index("ix_product_search", search_vector, postgresql_using="gin"),
+        # Serve substring ILIKE on name and SKU (e.g. partial SKUs)
+        db.Index("ix_product_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        db.Index("ix_product_sku_trgm", "sku", postgresql_using="gin", postgresql_ops={"sku": "gin_trgm_ops"}),
+    )
+    
+    # Variant aggregates, only populated on queries built with `with_summary()`
+    min_price_ngn: M[Optional[float]] = query_expression()
+    min_price_usd: M[Optional[float]] = query_expression()
+    total_stock: M[Optional[int]] = query_expression()
+    variant_colors: M[Optional[str]] = query_expression()
+    
     # Relationships
     variants = relationship("ProductVariant", back_populates="product", cascade="all, delete-orphan")
-    images = relationship("Media", secondary="product_media", lazy="dynamic", backref="products")
+    images = relationship("Media", secondary="product_media", lazy="selectin", backref="products")
     categories = db.relationship("ProductCategory", secondary=product_categories, backref=db.backref("products", lazy="dynamic"))
     materials = relationship("ProductMaterial", secondary="product_materials", back_populates="products")
     
@@ -164,13 +213,121 @@ class Product(db.Model):
         backref=db.backref("related_to", lazy="dynamic")
     )
     
+    # Plain column fields of `to_dict`; aliases, relationships and variant
+    # aggregates are added by hand
+    __serialize_spec__ = (
+        ("id", None),
+        ("name", None),
+        ("sku", None),
+        ("slug", None),
+        ("description", str_or_empty),
+        ("category", None),
+        ("care", str_or_empty),
+        ("details", str_or_empty),
+        ("meta_title", None),
+        ("meta_description", None),
+        ("meta_keywords", None),
+        ("launch_status", None),
+        ("created_at", None),
+        ("updated_at", None),
+    )
+    
     def __repr__(self) -> str:
         return f"<Product {self.id}, {self.name}>"
     
+    @classmethod
+    def list_options(cls, include_variants: bool = True) -> list:
+        """
+        Loader options for product listings serialized with `to_dict`.
+        
+        Every relationship `to_dict` touches is loaded up front with one IN
+        query each; any other relationship of the product raises instead of
+        lazy loading per row, so a new access shows up as an error rather
+        than a hidden N+1.
+        
+        Args:
+            include_variants: Load variants too. Listings built with
+                `with_summary()` that don't render variants can skip them.
+        """
+        options = []
+        if include_variants:
+            variants = selectinload(cls.variants)
+            options += [
+                variants.selectinload(ProductVariant.inventory),
+                variants.selectinload(ProductVariant.images),
+                variants.selectinload(ProductVariant.materials),
+            ]
+        return options + [
+            selectinload(cls.images),
+            selectinload(cls.materials),
+            # Only the ids of linked/related products are serialized
+            selectinload(cls.linked_products).load_only(cls.id).raiseload("*"),
+            selectinload(cls.related_products).load_only(cls.id).raiseload("*"),
+            raiseload("*"),
+        ]
+    
+    @classmethod
+    def with_summary(cls, query: Query) -> Query:
+        """
+        Join per-product variant aggregates onto a product query.
+        
+        Fills `min_price_ngn`, `min_price_usd`, `total_stock` and
+        `variant_colors` from one grouped subquery over active variants, so
+        `to_dict` reports price, color and stock without loading variants.
+        """
+        color = func.nullif(ProductVariant.attributes["color"].astext, "")
+        summary = (
+            db.session.query(
+                ProductVariant.product_id.label("product_id"),
+                func.min(func.nullif(ProductVariant.price_ngn, 0)).label("min_price_ngn"),
+                func.min(func.nullif(ProductVariant.price_usd, 0)).label("min_price_usd"),
+                func.sum(func.coalesce(Inventory.quantity, 0)).label("total_stock"),
+                func.string_agg(distinct(color), ", ").label("variant_colors"),
+            )
+            .outerjoin(Inventory, Inventory.variant_id == ProductVariant.id)
+            .filter(ProductVariant.deleted_at.is_(None))
+            .group_by(ProductVariant.product_id)
+            .subquery()
+        )
+        return query.outerjoin(summary, summary.c.product_id == cls.id).options(
+            with_expression(cls.min_price_ngn, summary.c.min_price_ngn),
+            with_expression(cls.min_price_usd, summary.c.min_price_usd),
+            with_expression(cls.total_stock, func.coalesce(summary.c.total_stock, 0)),
+            with_expression(cls.variant_colors, func.coalesce(summary.c.variant_colors, "")),
+        )
+    
+    @classmethod
+    def list_to_dicts(cls, products: List["Product"], include_variants: bool = False) -> List[Dict[str, Any]]:
+        """
+        Serialize a page of products in one pass.
+        
+        Materials shared between products and variants are serialized once for
+        the whole page. Pair with `list_options()` so images, variants and
+        materials arrive in one IN query each.
+        """
+        material_cache: Dict[Any, Dict[str, Any]] = {}
+        return [p.to_dict(include_variants=include_variants, material_cache=material_cache) for p in products]
+    
     @staticmethod
     def add_search_filters(query: Query, search_term: str) -> Query:
-        """Add search filters to a query."""
-        if search_term:
+        """
+        Add search filters to a query.
+        
+        Terms of three or more characters match whole words of the name, SKU,
+        description or slug through the `search_vector` GIN index, or any
+        substring of the name or SKU through their trigram indexes. Shorter
+        terms, which trigrams can't serve, fall back to ILIKE on all four.
+        """
+        if search_term and len(search_term) >= 3:
+            pattern = f"%{search_term}%"
+            query = query.filter(
+                or_(
+                    Product.search_vector.op("@@")(func.plainto_tsquery("simple", search_term)),
+                    Product.name.ilike(pattern),
+                    Product.sku.ilike(pattern),
+                )
+            )
+        elif search_term:
             search_term = f"%{search_term}%"
             query = query.filter(
                 or_(
@@ -182,38 +339,39 @@ class Product(db.Model):
             )
         return query
     
-    def to_dict(self, include_variants: bool = False) -> Dict[str, Any]:
-        """Convert product to dictionary."""
-        data = {
-            "id": str(self.id),
-            "name": self.name,
-            "sku": self.sku,
-            "slug": self.slug,
-            "description": self.description or "",
-            "category": self.category,
-            "care": self.care or "",
-            "details": self.details or "",
-            "material_ids": [str(m.id) for m in self.materials] if self.materials else [],
-            "materials": [m.to_dict() for m in self.materials] if self.materials else [],
-            "metadata": self.product_metadata or {},
-            "meta_title": self.meta_title,
-            "meta_description": self.meta_description,
-            "meta_keywords": self.meta_keywords,
-            "status": self.launch_status,  # Alias for launch_status
-            "launch_status": self.launch_status,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            
-            # Linked and Related Products (IDs only by default to avoid recursion)
-            "linked_product_ids": [str(p.id) for p in self.linked_products] if self.linked_products else [],
-            "related_product_ids": [str(p.id) for p in self.related_products] if self.related_products else [],
-        }
+    def to_dict(self, include_variants: bool = False, material_cache: Optional[dict] = None) -> Dict[str, Any]:
+        """
+        Convert product to dictionary.
+        
+        Args:
+            include_variants: Whether to include active variants
+            material_cache: Shared across a list so each material is serialized once
+        """
+        data = self._spec_to_dict()
+        materials = self.materials
+        data["material_ids"] = [m.id for m in materials]
+        data["materials"] = ProductMaterial.to_dicts(materials, material_cache)
+        data["metadata"] = self.product_metadata or {}
+        data["status"] = data["launch_status"]  # Alias for launch_status
+        
+        # Linked and Related Products (IDs only by default to avoid recursion)
+        data["linked_product_ids"] = [p.id for p in self.linked_products]
+        data["related_product_ids"] = [p.id for p in self.related_products]
         
         # Calculate price, color, and stock from variants (always, even if not including full variant objects)
-        active_variants = [v for v in self.variants if v.deleted_at is None]
-        if active_variants:
-            prices_ngn = [float(v.price_ngn) for v in active_variants if v.price_ngn]
-            prices_usd = [float(v.price_usd) for v in active_variants if v.price_usd]
+        summarized = self.total_stock is not None
+        active_variants = [v for v in self.variants if v.deleted_at is None] if include_variants or not summarized else []
+        if summarized:
+            # Already aggregated in SQL by `with_summary()`
+            min_ngn, min_usd = self.min_price_ngn, self.min_price_usd
+            data["price_ngn"] = float(min_ngn) if min_ngn is not None else None
+            data["price_usd"] = float(min_usd) if min_usd is not None else None
+            data["price"] = data["price_ngn"]  # Alias for price_ngn
+            data["color"] = self.variant_colors
+            data["stock"] = int(self.total_stock)
+        elif active_variants:
+            prices_ngn = [v.price_ngn for v in active_variants if v.price_ngn]
+            prices_usd = [v.price_usd for v in active_variants if v.price_usd]
             data["price_ngn"] = min(prices_ngn) if prices_ngn else None
             data["price_usd"] = min(prices_usd) if prices_usd else None
             data["price"] = data["price_ngn"]  # Alias for price_ngn
@@ -238,21 +396,25 @@ class Product(db.Model):
             data["stock"] = 0
         
         # Include product images
-        images = [img.to_dict() for img in self.images.all()]
-        data["images"] = images
+        images = self.images
+        data["images"] = [img.to_dict() for img in images]
         # Also include image URLs as a simple array for convenience
-        data["image_urls"] = [img.file_url for img in self.images.all()]
+        data["image_urls"] = [img.file_url for img in images]
         
         if include_variants:
             # Include variants with all details including prices
-            data["variants"] = [v.to_dict(include_inventory=True) for v in active_variants]
+            data["variants"] = [v.to_dict(include_inventory=True, material_cache=material_cache) for v in active_variants]
         
         return data
 
 
-class ProductVariant(db.Model):
+class ProductVariant(SerializableMixin, db.Model):
     """
     Product variant model representing a specific SKU (e.g., 32" straight, black).
+    
+    `attributes` has a GIN index for containment (`@>`) filters, plus BTREE
+    expression indexes on `attributes->>'color'` and `attributes->>'length'`
+    for equality and ordering on those keys.
     """
     __tablename__ = "product_variant"
     
@@ -260,21 +422,21 @@ class ProductVariant(db.Model):
     product_id: M[uuid.UUID] = db.Column(UUID(as_uuid=True), db.ForeignKey("product.id", ondelete="CASCADE"), nullable=False, index=True)
     sku: M[str] = db.Column(db.String(100), nullable=False, unique=True, index=True)
     
-    # Pricing
-    price_ngn: M[float] = db.Column(db.Numeric(14, 2), nullable=False)
-    price_usd: M[Optional[float]] = db.Column(db.Numeric(14, 2))
+    # Pricing; returned as float, which is all the serializers ever need
+    price_ngn: M[float] = db.Column(db.Numeric(14, 2, asdecimal=False), nullable=False)
+    price_usd: M[Optional[float]] = db.Column(db.Numeric(14, 2, asdecimal=False))
     
     # Physical attributes
     weight_g: M[Optional[int]] = db.Column(db.Integer)  # Weight in grams
     
     # Product attributes stored as JSON
     # Contains: length, texture, color, lace_type, density, cap_size, hair_type
-    attributes: M[Dict[str, Any]] = db.Column(JSON, default=dict)
+    attributes: M[Dict[str, Any]] = db.Column(JSONB, default=dict, server_default=text("'{}'::jsonb"))
     
     # Relationships
     product = relationship("Product", back_populates="variants")
     inventory = relationship("Inventory", back_populates="variant", uselist=False, cascade="all, delete-orphan")
-    images = relationship("Media", secondary="variant_media", lazy="dynamic", backref="variants")
+    images = relationship("Media", secondary="variant_media", lazy="selectin", backref="variants")
     materials = relationship("ProductMaterial", secondary="variant_materials", back_populates="variants")
     
     # Timestamps
@@ -282,6 +444,33 @@ class ProductVariant(db.Model):
     updated_at: M[datetime] = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow, onupdate=QuasDateTime.aware_utcnow)
     deleted_at: M[Optional[datetime]] = db.Column(db.DateTime(timezone=True), nullable=True)
     
+    __table_args__ = (
+        # jsonb_path_ops serves containment lookups (attributes @> '{"color": ...}')
+        db.Index(
+            "ix_pv_attrs_gin",
+            attributes,
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"},
+        ),
+        # ->> lookups can't use the GIN index above
+        db.Index("ix_pv_color", attributes["color"].astext.label("attr_color")),
+        db.Index("ix_pv_length", attributes["length"].astext.label("attr_length")),
+    )
+    
+    # Plain fields of `to_dict`; price_usd, color and aliases are added by hand
+    __serialize_spec__ = (
+        ("id", None),
+        ("product_id", None),
+        ("sku", None),
+        ("price_ngn", None),
+        ("weight_g", None),
+        ("attributes", dict_or_empty),
+        ("is_in_stock", None),
+        ("stock_quantity", None),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<ProductVariant {self.id}, SKU: {self.sku}>"
     
@@ -299,36 +488,25 @@ class ProductVariant(db.Model):
             return self.inventory.quantity
         return 0
     
-    def to_dict(self, include_inventory: bool = False, include_product_info: bool = False) -> Dict[str, Any]:
+    def to_dict(self, include_inventory: bool = False, include_product_info: bool = False, material_cache: Optional[dict] = None) -> Dict[str, Any]:
         """Convert variant to dictionary."""
+        data = self._spec_to_dict()
+        data["price_usd"] = self.price_usd or None
+        data["price"] = data["price_ngn"]  # Alias for price_ngn
+        data["stock"] = data["stock_quantity"]  # Alias for stock_quantity
+        
         # Extract color from attributes
-        color = ""
-        if self.attributes and isinstance(self.attributes, dict):
-            color = self.attributes.get("color", "") or ""
+        attributes = data["attributes"]
+        data["color"] = (attributes.get("color", "") or "") if isinstance(attributes, dict) else ""
         
-        data = {
-            "id": str(self.id),
-            "product_id": str(self.product_id),
-            "sku": self.sku,
-            "price_ngn": float(self.price_ngn),
-            "price_usd": float(self.price_usd) if self.price_usd else None,
-            "price": float(self.price_ngn),  # Alias for price_ngn
-            "weight_g": self.weight_g,
-            "attributes": self.attributes or {},
-            "color": color,
-            "is_in_stock": self.is_in_stock,
-            "stock_quantity": self.stock_quantity,
-            "stock": self.stock_quantity,  # Alias for stock_quantity
-            "material_ids": [str(m.id) for m in self.materials] if self.materials else [],
-            "materials": [m.to_dict() for m in self.materials] if self.materials else [],
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
+        materials = self.materials
+        data["material_ids"] = [m.id for m in materials]
+        data["materials"] = ProductMaterial.to_dicts(materials, material_cache)
         
         # Include variant images
-        images = [img.to_dict() for img in self.images.all()]
-        data["images"] = images
-        data["image_urls"] = [img.file_url for img in self.images.all()]
+        images = self.images
+        data["images"] = [img.to_dict() for img in images]
+        data["image_urls"] = [img.file_url for img in images]
         
         # Inherit fields from parent product
         if include_product_info and self.product:
@@ -340,9 +518,9 @@ class ProductVariant(db.Model):
             data["details"] = self.product.details or ""
             data["materials"] = [m.to_dict() for m in self.product.materials] if self.product.materials else []
             # Include product images as well
-            product_images = [img.to_dict() for img in self.product.images.all()]
-            data["product_images"] = product_images
-            data["product_image_urls"] = [img.file_url for img in self.product.images.all()]
+            product_images = self.product.images
+            data["product_images"] = [img.to_dict() for img in product_images]
+            data["product_image_urls"] = [img.file_url for img in product_images]
         
         if include_inventory and self.inventory:
             data["inventory"] = self.inventory.to_dict()
@@ -365,7 +543,7 @@ variant_media = db.Table(
 )
 
 
-class Inventory(db.Model):
+class Inventory(SerializableMixin, db.Model):
     """
     Inventory model tracking stock levels per variant.
     """
@@ -383,6 +561,16 @@ class Inventory(db.Model):
     # Relationships
     variant = relationship("ProductVariant", back_populates="inventory")
     
+    __serialize_spec__ = (
+        ("id", None),
+        ("variant_id", None),
+        ("quantity", None),
+        ("low_stock_threshold", None),
+        ("is_low_stock", None),
+        ("created_at", to_gmt1_or_none),
+        ("updated_at", to_gmt1_or_none),
+    )
+    
     def __repr__(self) -> str:
         return f"<Inventory {self.id}, Variant: {self.variant_id}, Qty: {self.quantity}>"
     
@@ -390,16 +578,5 @@ class Inventory(db.Model):
     def is_low_stock(self) -> bool:
         """Check if inventory is below low stock threshold."""
         return self.quantity <= self.low_stock_threshold
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert inventory to dictionary."""
-        return {
-            "id": str(self.id),
-            "variant_id": str(self.variant_id),
-            "quantity": self.quantity,
-            "low_stock_threshold": self.low_stock_threshold,
-            "is_low_stock": self.is_low_stock,
-            "created_at": to_gmt1_or_none(self.created_at),
-            "updated_at": to_gmt1_or_none(self.updated_at),
-        }
+
 
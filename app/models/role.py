@@ -107,7 +107,7 @@ class UserRole(db.Model):
                     )
 
             assigner_name = assigner.username if assigner else "default"
-            log_event(data=f"Role '{role.name.value}' assigned to user '{user.username}' by '{assigner_name}'.")
+            log_event("Role assigned", role=role.name.value, username=user.username, assigner=assigner_name)
 
             return user_role
         
@@ -13,7 +13,7 @@ from __future__ import annotations
 from flask import current_app
 from slugify import slugify
 from typing import TYPE_CHECKING, List, Optional, cast
-from sqlalchemy import inspect, or_
+from sqlalchemy import func, inspect, or_, select
 from sqlalchemy.orm import Query, backref
 from sqlalchemy.orm import Mapped as M, DynamicMapped as DM  # type: ignore
 from sqlalchemy.dialects.postgresql import UUID
@@ -60,8 +60,20 @@ class AppUser(db.Model):
     username: M[Optional[str]] = db.Column(db.String(50), nullable=True, unique=True)
     password_hash = db.Column(db.String(255), nullable=True)
     has_updated_default_password = db.Column(db.Boolean, default=False, nullable=False)
-    date_joined = db.Column(db.DateTime(timezone=True), default=QuasDateTime.aware_utcnow)
+    # Keyset pagination sorts and encodes cursors on this column, so it can't be NULL
+    date_joined = db.Column(db.DateTime(timezone=True), nullable=False, default=QuasDateTime.aware_utcnow, server_default=func.now())
     
+    __table_args__ = (
+        # Backs newest-first keyset pagination in the admin user list
+        db.Index('ix_app_user_date_joined_id', date_joined.desc(), id.desc()),
+        # Trigram indexes let the admin search's ILIKE '%term%' use an index scan
+        db.Index('ix_app_user_username_trgm', 'username', postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'}),
+        # Emails are matched case-insensitively, so index the lowered value
+        db.Index(
+            'ix_app_user_email_lower_trgm', db.func.lower(email).label('email_lower'),
+            postgresql_using='gin', postgresql_ops={'email_lower': 'gin_trgm_ops'}
+        ),
+    )
     
     # Relationships
     profile = db.relationship('Profile', back_populates="app_user", uselist=False, cascade="all, delete-orphan")
@@ -106,8 +118,9 @@ class AppUser(db.Model):
     @property
     def role_names(self) -> list[str]:
         """Returns a list of role names for the user."""
-        if not db.inspect(self).persistent:
-            # Reattach to session if necessary
+        state = db.inspect(self)
+        if not state.persistent and "roles" in state.unloaded:
+            # Reattach to session if the roles still need loading
             self = db.session.merge(self)
         user_roles = cast(List["UserRole"], self.roles)
         return [str(user_role.role.name.value) for user_role in user_roles]
@@ -121,15 +134,20 @@ class AppUser(db.Model):
         if search_term:
             search_term = f"%{search_term}%"
             
-            # Join the Profile table using outerjoin to include users without a profile
-            query = query.outerjoin(Profile)
+            # Match profile names through a subquery rather than a join so each
+            # table's predicates can be answered by its own trigram index
+            profile_matches = select(Profile.user_id).where(
+                or_(
+                    Profile.firstname.ilike(search_term),
+                    Profile.lastname.ilike(search_term)
+                )
+            )
             
             query = query.filter(
                     or_(
                         AppUser.username.ilike(search_term),
-                        AppUser.email.ilike(search_term),
-                        Profile.firstname.ilike(search_term),
-                        Profile.lastname.ilike(search_term)
+                        func.lower(AppUser.email).like(search_term.lower()),
+                        AppUser.id.in_(profile_matches)
                     )
                 )
         return query
@@ -207,6 +225,11 @@ class Profile(db.Model):
     user_id = db.Column(UUID(as_uuid=True), db.ForeignKey('app_user.id', ondelete='CASCADE'), nullable=False,)
     app_user = db.relationship('AppUser', back_populates="profile")
     
+    __table_args__ = (
+        db.Index('ix_profile_firstname_trgm', 'firstname', postgresql_using='gin', postgresql_ops={'firstname': 'gin_trgm_ops'}),
+        db.Index('ix_profile_lastname_trgm', 'lastname', postgresql_using='gin', postgresql_ops={'lastname': 'gin_trgm_ops'}),
+    )
+    
     def __repr__(self):
         return f'<profile ID: {self.id}, name: {self.firstname}>'
     
@@ -4,7 +4,7 @@ Pydantic schemas for B2B inquiry endpoints.
 
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field, EmailStr
 
 
@@ -17,7 +17,8 @@ class CreateB2BInquiryRequest(BaseModel):
     phone: str = Field(..., min_length=1, description="Contact phone")
     country: str = Field(..., min_length=2, max_length=100, description="Country")
     expected_volume: Optional[str] = Field(None, description="Expected monthly purchase volume")
-    product_categories: Optional[List[str]] = Field(None, description="Product categories of interest")
+    # Stored as VARCHAR(100)[]; longer names must be rejected here, not by the database
+    product_categories: Optional[List[Annotated[str, Field(max_length=100)]]] = Field(None, description="Product categories of interest")
     note: Optional[str] = Field(None, description="Additional message")
 
 
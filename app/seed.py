@@ -72,8 +72,10 @@ def seed_admin_user(clear: bool = False) -> None:
             # User exists in Clerk, use existing user
             clerk_id = existing_clerk_user.get('id')
             log_event(
-                f"Found existing Clerk user for super admin. Email: {super_admin_email}, Clerk ID: {clerk_id}",
-                event_type="seeding"
+                "Found existing Clerk user for super admin",
+                event_type="seeding",
+                email=super_admin_email,
+                clerk_id=clerk_id,
             )
         else:
             # Create user in Clerk
@@ -124,8 +126,10 @@ def seed_admin_user(clear: bool = False) -> None:
         UserRole.assign_role(admin_user, super_admin_role, commit=True)
         
         log_event(
-            f"Super Admin user created successfully. Email: {super_admin_email}, Clerk ID: {clerk_id}",
-            event_type="seeding"
+            "Super Admin user created successfully",
+            event_type="seeding",
+            email=super_admin_email,
+            clerk_id=clerk_id,
         )
         
     except Exception as e:
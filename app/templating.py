@@ -0,0 +1,28 @@
+from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+from jinja2.utils import LRUCache
+
+
+def configure_templates(app: Flask) -> None:
+    """
+    Configure Jinja template caching.
+
+    Compiled templates are kept in an in-process LRU cache and their bytecode
+    is persisted to disk, so a cold worker loads templates without
+    re-compiling them. Outside of debug, templates are not re-checked for
+    changes on every render.
+
+    Args:
+        app: The Flask application instance
+    """
+    app.jinja_env.cache = LRUCache(app.config.get("JINJA_CACHE_SIZE", 400))
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config.get("JINJA_BYTECODE_CACHE_DIR"))
+
+    if not app.debug:
+        app.jinja_env.auto_reload = False
+
+
+def warm_templates(app: Flask, template_names: list[str]) -> None:
+    """Load templates into the Jinja cache ahead of the first request."""
+    for name in template_names:
+        app.jinja_env.get_template(name)
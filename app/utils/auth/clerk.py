@@ -27,7 +27,7 @@ _jwks_client_cache: Dict[str, Tuple[float, "PyJWKClient"]] = {}
 _JWKS_CACHE_TTL_SECONDS = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticatedUser:
     """Normalized user object from Clerk authentication."""
     clerk_id: str
@@ -84,6 +84,11 @@ def validate_clerk_token(token: str) -> Optional[Dict[str, Any]]:
     Returns:
         Decoded token payload if valid, None otherwise.
     """
+    # A JWT is exactly three dot-separated segments; reject junk cookies and
+    # headers before any decoding or exception handling
+    if not isinstance(token, str) or token.count(".") != 2:
+        return None
+
     try:
         import jwt
 
@@ -298,7 +303,7 @@ def create_clerk_user(
                 }
         else:
             error_detail = api_response.json() if api_response.text else {}
-            log_error(f"Clerk user creation failed: {api_response.status_code}", error=error_detail)
+            log_error("Clerk user creation failed", error=error_detail, status_code=api_response.status_code)
         
         return None
     except Exception as e:
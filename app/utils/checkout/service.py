@@ -36,8 +36,11 @@ from ...utils.auth.clerk import create_clerk_user
 from ...logging import log_error, log_event
 from config import Config
 
+# Fresh order numbers to try before giving up on a (vanishingly rare) collision
+ORDER_NUMBER_ATTEMPTS = 10
 
-@dataclass
+
+@dataclass(slots=True)
 class CheckoutRequest:
     """Request data for checkout."""
     cart_id: Optional[str] = None
@@ -56,7 +59,7 @@ class CheckoutRequest:
     last_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckoutResult:
     """Result of checkout processing."""
     success: bool
@@ -147,7 +150,7 @@ def process_checkout(request: CheckoutRequest, current_user: Optional[AppUser] =
             cache_key = f"checkout:idempotency:{request.idempotency_key}"
             cached_result = app_cache.get(cache_key)
             if cached_result:
-                log_event(f"Idempotent checkout request: {request.idempotency_key}")
+                log_event("Idempotent checkout request", idempotency_key=request.idempotency_key)
                 return CheckoutResult(**cached_result)
         
         # Step 1: Load cart
@@ -226,16 +229,27 @@ def process_checkout(request: CheckoutRequest, current_user: Optional[AppUser] =
         order.guest_phone = request.phone
         
         db.session.add(order)
-        db.session.flush()
+        for attempts_left in reversed(range(ORDER_NUMBER_ATTEMPTS)):
+            try:
+                db.session.flush()
+                break
+            except IntegrityError as e:
+                # The unique index on order_number is the collision check; anything else is a real error
+                db.session.rollback()
+                if attempts_left == 0 or "order_number" not in str(e.orig):
+                    raise
+                order.order_number = Order.generate_order_number()
+                db.session.add(order)
         
-        # Create order items
-        for item_data in items_to_order:
-            order_item = OrderItem()
-            order_item.order_id = order.id
-            order_item.variant_id = item_data["variant"].id
-            order_item.quantity = item_data["quantity"]
-            order_item.unit_price = Decimal(str(item_data["unit_price"]))
-            db.session.add(order_item)
+        # Create order items in a single multi-row INSERT
+        OrderItem.bulk_insert(order.id, [
+            {
+                "variant_id": item_data["variant"].id,
+                "quantity": item_data["quantity"],
+                "unit_price": Decimal(str(item_data["unit_price"])),
+            }
+            for item_data in items_to_order
+        ])
         
         db.session.commit()
         
@@ -264,7 +278,7 @@ def process_checkout(request: CheckoutRequest, current_user: Optional[AppUser] =
         order.payment_url = payment_response.get("authorization_url")
         db.session.commit()
         
-        log_event(f"Checkout initialized: Order {order.order_number}, Total: {total}")
+        log_event("Checkout initialized", order_number=order.order_number, total=total)
         
         # Step 8: Send order confirmation email
         recipient_email = current_user.email if current_user else request.email
@@ -9,14 +9,16 @@ The decorators validate Clerk tokens and enforce RBAC using roles stored in the
 '''
 from functools import wraps
 from typing import Callable, TypeVar, Any, ParamSpec, cast, Optional, Iterable, Set
-from flask import g, request, Response, redirect, url_for, abort
+from flask import g, request, Response, redirect, abort
 from flask.typing import ResponseReturnValue
+from sqlalchemy.orm import selectinload
 
 from app.models.user import AppUser
 from app.models.role import UserRole as TUserRole
 from app.extensions import db
 from quas_utils.logging.loggers import console_log
 from quas_utils.api import error_response
+from ..helpers.routing import cached_url_for_next
 from ..helpers.roles import normalize_role
 from ..auth.clerk import get_clerk_user_from_token, get_or_create_app_user_from_clerk
 
@@ -58,19 +60,24 @@ def _load_existing_app_user(clerk_user) -> Optional[AppUser]:
     """
     Load an existing AppUser using clerk_id or email.
     This avoids creating new users for the admin UI path.
+
+    Roles are loaded with the user since the admin guard checks them right
+    away; customer paths load users without them.
     """
     if not clerk_user:
         return None
 
+    query = AppUser.query.options(selectinload(AppUser.roles).selectinload(TUserRole.role))
+
     # First: by clerk_id
     if clerk_user.clerk_id:
-        app_user = AppUser.query.filter_by(clerk_id=clerk_user.clerk_id).first()
+        app_user = query.filter_by(clerk_id=clerk_user.clerk_id).first()
         if app_user:
             return app_user
 
     # Fallback: by email, then link clerk_id for future lookups
     if clerk_user.email:
-        app_user = AppUser.query.filter_by(email=clerk_user.email).first()
+        app_user = query.filter_by(email=clerk_user.email).first()
         if app_user:
             if not app_user.clerk_id:
                 app_user.clerk_id = clerk_user.clerk_id
@@ -188,7 +195,7 @@ def roles_required_web(
         def _impl(*args: P.args, **kwargs: P.kwargs) -> R:
             def _redirect_with_cookie_clear() -> R:
                 """Helper to redirect to login and clear cookies."""
-                resp = redirect(url_for(login_endpoint, next=request.url, _external=False))
+                resp = redirect(cached_url_for_next(login_endpoint))
                 # Clear common Clerk cookies to avoid redirect loops on expired tokens
                 for cookie_name in ("__session", "clerk_session", "__clerk"):
                     resp.delete_cookie(cookie_name, path="/")
@@ -10,7 +10,7 @@ import os, sys
 from threading import Thread
 from typing import Optional
 from sqlalchemy import desc
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, joinedload
 from flask_sqlalchemy.pagination import Pagination # Import Pagination if needed
 from werkzeug.datastructures import FileStorage
 from flask import Flask, request, jsonify, current_app
@@ -53,6 +53,7 @@ def fetch_all_categories(
         paginate: bool = False,
         parent_only: bool = True,
         search_term: Optional[str] = "",
+        with_media: bool = False,
     ) -> list[ProductCategory] | Pagination:
     ''' Get categories from the database with optional filtering and pagination.
     
@@ -65,6 +66,7 @@ def fetch_all_categories(
         paginate: Return pagination object when True
         parent_only: Only return top-level categories when no cat_id specified
         search_term: Filter term for category search
+        with_media: Load each category's thumbnail media in the same query
 
     Returns:
         Pagination object or list of ProductCategory instances
@@ -81,6 +83,8 @@ def fetch_all_categories(
         search_term = request.args.get("search", "").strip()
 
     query: Query = ProductCategory.query
+    if with_media:
+        query = query.options(joinedload(ProductCategory.media))
     
     # Apply parent category filters
     if cat_id is not None:
@@ -0,0 +1,144 @@
+"""
+Keyset (seek) pagination helpers.
+
+Pages are addressed by an opaque cursor encoding the sort key of the row on
+the edge of the current page, so fetching any page is an index range scan
+instead of an ``OFFSET`` walk plus a ``COUNT(*)``.
+
+Also holds :func:`estimate_table_rows` for offset-paginated listings that
+only need an approximate total.
+
+Author: Emmanuel Olowu
+Link: https://github.com/zeddyemy
+Package: Kezura
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import Query, InstrumentedAttribute
+
+
+def estimate_table_rows(table_name: str) -> Optional[int]:
+    """
+    Return PostgreSQL's planner estimate of a table's row count.
+
+    Reads ``pg_class.reltuples`` (kept current by autovacuum/ANALYZE) instead of
+    running ``COUNT(*)`` over the whole table.
+
+    Returns:
+        The estimated row count, or None if the table has never been analyzed.
+    """
+    from app.extensions import db
+
+    estimate = db.session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"),
+        {"name": table_name},
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+@dataclass(slots=True)
+class KeysetPage:
+    """A single page of keyset-paginated results."""
+    items: list[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+
+def encode_cursor(timestamp: datetime, row_id: uuid.UUID) -> str:
+    """Encode a ``(timestamp, id)`` sort key as a URL-safe cursor token."""
+    raw = json.dumps([timestamp.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[tuple[datetime, uuid.UUID]]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Returns:
+        ``(timestamp, id)`` tuple, or None if the token is missing or malformed.
+    """
+    if not token:
+        return None
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(timestamp), uuid.UUID(row_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def keyset_paginate(
+        query: Query,
+        timestamp_col: InstrumentedAttribute,
+        id_col: InstrumentedAttribute,
+        per_page: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage:
+    ''' Paginate a query newest-first on ``(timestamp_col, id_col)``.
+
+    Args:
+        query: Base query (filters applied, no ordering)
+        timestamp_col: Primary sort column, e.g. ``AppUser.date_joined``
+        id_col: Tie-breaking unique column, e.g. ``AppUser.id``
+        per_page: Items per page
+        after: Cursor of the last row on the previous page (move forward)
+        before: Cursor of the first row on the next page (move backward)
+
+    Returns:
+        KeysetPage with the items and cursors for the adjacent pages
+    '''
+    sort_key = tuple_(timestamp_col, id_col)
+    after_key = decode_cursor(after)
+    before_key = decode_cursor(before) if after_key is None else None
+
+    if before_key is not None:
+        # Walk backwards in ascending order, then flip to keep newest-first
+        rows = (
+            query.filter(sort_key > before_key)
+            .order_by(timestamp_col.asc(), id_col.asc())
+            .limit(per_page + 1)
+            .all()
+        )
+        has_more = len(rows) > per_page
+        items = list(reversed(rows[:per_page]))
+        has_prev, has_next = has_more, True
+    else:
+        if after_key is not None:
+            query = query.filter(sort_key < after_key)
+        rows = (
+            query.order_by(timestamp_col.desc(), id_col.desc())
+            .limit(per_page + 1)
+            .all()
+        )
+        items = rows[:per_page]
+        has_prev, has_next = after_key is not None, len(rows) > per_page
+
+    def _cursor_for(item: Any) -> str:
+        return encode_cursor(getattr(item, timestamp_col.key), getattr(item, id_col.key))
+
+    return KeysetPage(
+        items=items,
+        next_cursor=_cursor_for(items[-1]) if items and has_next else None,
+        prev_cursor=_cursor_for(items[0]) if items and has_prev else None,
+    )
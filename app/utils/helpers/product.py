@@ -68,7 +68,7 @@ def fetch_product(identifier: str) -> Optional[Product]:
         product = Product.query.filter_by(slug=identifier).first()
         return product
     except Exception as e:
-        log_error(f"Failed to fetch product {identifier}", error=e)
+        log_error("Failed to fetch product", error=e, identifier=identifier)
         return None
 
 
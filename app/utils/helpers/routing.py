@@ -0,0 +1,71 @@
+"""
+Request path classification helpers.
+
+The URL prefix decides whether a request gets JSON (API) or HTML (admin/web)
+responses. It is classified once per request and cached on ``g`` so error
+handlers and helpers don't repeat the prefix checks.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import urlencode
+
+from flask import current_app, g, request, url_for
+
+API_PREFIX = "/api"
+ADMIN_PREFIX = "/admin"
+
+
+def classify_path(path: str) -> str:
+    """Return the route class (``"api"``, ``"admin"`` or ``"web"``) for a URL path."""
+    # Both prefixes start with "/a"; every other path is settled by one character
+    if path[1:2] != "a":
+        return "web"
+    if path.startswith(API_PREFIX):
+        return "api"
+    if path.startswith(ADMIN_PREFIX):
+        return "admin"
+    return "web"
+
+
+def get_route_class() -> str:
+    """
+    Return the route class of the current request.
+
+    Normally set by the ``setup_resources`` before-request hook; computed on
+    demand if an error was raised before that hook ran.
+    """
+    route_class = g.get("route_class")
+    if route_class is None:
+        route_class = g.route_class = classify_path(request.path)
+    return route_class
+
+
+def is_api_request() -> bool:
+    """Return True if the current request targets the JSON API."""
+    return get_route_class() == "api"
+
+
+
+def cached_url_for(endpoint: str) -> str:
+    """
+    Return ``url_for(endpoint)`` for an endpoint that takes no arguments,
+    building it at most once per application and script root.
+
+    Meant for fixed redirect targets on hot or error paths; endpoints with
+    URL variables must keep using ``url_for`` directly.
+    """
+    cache: dict[tuple[str, str], str] = current_app.extensions.setdefault("cached_urls", {})
+    key = (endpoint, request.script_root)
+    url = cache.get(key)
+    if url is None:
+        url = cache[key] = url_for(endpoint)
+    return url
+
+
+def cached_url_for_next(endpoint: str) -> str:
+    """
+    Return the cached URL for `endpoint` with ``?next=`` pointing back at the
+    current request, as used by login redirects.
+    """
+    return f"{cached_url_for(endpoint)}?{urlencode({'next': request.url})}"
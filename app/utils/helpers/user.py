@@ -5,13 +5,14 @@ Copyright: © 2024 Emmanuel Olowu <zeddyemy@gmail.com>
 License: GNU, see LICENSE for more details.
 Package: Kezura
 """
-from flask import request, g
+from flask import g
 from typing import List, Optional, Any, cast
 import uuid
 
 from ...models import AppUser, Profile
 from quas_utils.misc import generate_random_string
 from quas_utils.logging.loggers import console_log
+from .routing import is_api_request
 
 
 def get_current_user() -> Optional[AppUser]:
@@ -29,7 +30,7 @@ def get_current_user() -> Optional[AppUser]:
         return g.current_user
     
     # Fallback to legacy JWT/Flask-Login for backward compatibility
-    if request.path.startswith('/api'):
+    if is_api_request():
         # Try legacy JWT (for admin/internal endpoints that haven't migrated yet)
         try:
             from flask_jwt_extended import get_jwt_identity
@@ -382,7 +382,7 @@ class PaymentManager:
                                     for cart_item in list(cart.items):
                                         db.session.delete(cart_item)
                                         db.session.delete(cart_item)
-                                log_event("order_payment_completed", f"Order payment completed for order_id={order_id}")
+                                log_event("order_payment_completed", order_id=order_id)
                                 
                                 # Send notification email
                                 try:
@@ -60,7 +60,7 @@ class PaystackProcessor(PaymentProcessor):
             "callback_url": redirect_url
         }
         
-        log_event("paystack_init_request", f"Initializing payment: amount={amount}, currency={currency}, email={customer_email}")
+        log_event("paystack_init_request", amount=amount, currency=currency, email=customer_email)
 
         try:
             response = requests.post(url, json=data, headers=headers)
@@ -68,9 +68,9 @@ class PaystackProcessor(PaymentProcessor):
             
             # Log the full response for debugging
             if not response_data.get("status"):
-                log_error("paystack_init_error", f"Paystack API error: {response_data.get('message', 'Unknown error')}", extra={"response": response_data})
+                log_error("paystack_init_error", response_data.get('message', 'Unknown error'), response=response_data)
             else:
-                log_event("paystack_init_success", f"Payment initialized: ref={self.reference}")
+                log_event("paystack_init_success", reference=self.reference)
             
             payment_response = PaymentProcessorResponse(
                 status="success" if response_data.get("status") else "error",
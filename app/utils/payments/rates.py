@@ -37,10 +37,17 @@ def fetch_exchange_rates(base_currency: str = "NGN") -> Optional[dict]:
     return None
 
 
-def convert_amount(amount_in_ngn, target_currency, format=True) -> str | Decimal:
+def convert_amount(amount_in_ngn, target_currency, format=True, exchange_rates: Optional[dict] = None) -> str | Decimal:
+    """
+    Convert an NGN amount to `target_currency`.
+    
+    Pass `exchange_rates` (from `fetch_exchange_rates`) when converting many
+    amounts, so the rate table is resolved once instead of per call.
+    """
     from ..helpers.money import format_currency, format_price
     
-    exchange_rates = fetch_exchange_rates() or {}
+    if exchange_rates is None:
+        exchange_rates = fetch_exchange_rates() or {}
     
     converted_amount = amount_in_ngn # Default to dollar if no rate is found
     
@@ -25,12 +25,29 @@ class Config(PaymentConfig):
     STATIC_FOLDER = "resources/static"
     TEMPLATE_FOLDER = "resources/templates"
     
+    # Jinja template caching
+    JINJA_CACHE_SIZE = int(os.getenv("JINJA_CACHE_SIZE", "400"))
+    JINJA_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR")  # Defaults to the system temp dir
+    
+    # Caching (Flask-Caching). SimpleCache is per-process; set CACHE_REDIS_URL so
+    # every worker shares one cache (verification codes, idempotency keys, rates)
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+    CACHE_TYPE = os.getenv("CACHE_TYPE") or ("RedisCache" if CACHE_REDIS_URL else "SimpleCache")
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "300"))
+    
     # CORS
     CORS_ORIGINS = os.getenv("CLIENT_ORIGINS", "http://localhost:3000,http://localhost:5173")
-    CORS_ORIGINS = [origin.strip() for origin in CORS_ORIGINS.split(",")]
+    # Exact origins only, deduplicated, so flask-cors does plain string compares
+    CORS_ORIGINS = list(dict.fromkeys(origin.strip() for origin in CORS_ORIGINS.split(",") if origin.strip()))
     
     # Database
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        "pool_pre_ping": True,  # Drop dead Postgres connections before use instead of 500ing
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
     SEED_DB = os.getenv("SEED_DB") or False
     DEFAULT_ADMIN_USERNAME = os.getenv("DEFAULT_ADMIN_USERNAME")
     DEFAULT_ADMIN_PASSWORD = os.getenv("DEFAULT_ADMIN_PASSWORD")
@@ -93,6 +110,8 @@ class ProductionConfig(Config):
 
 class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # In-memory SQLite uses a singleton pool; sizing options don't apply
+    CACHE_TYPE = "SimpleCache"
 
 
 # Map config based on environment
@@ -0,0 +1,122 @@
+-- Schema upgrades for existing databases.
+--
+-- The models in app/models describe the current schema, and new databases get
+-- it from them. A database created before one of the changes below needs the
+-- matching statements, applied in file order:
+--
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f sql/schema_upgrades.sql
+--
+-- Every statement is safe to re-run.
+
+
+-- Admin user list: keyset pagination on (date_joined, id).
+-- Backfill rows with no join date before the column becomes NOT NULL.
+UPDATE app_user SET date_joined = now() WHERE date_joined IS NULL;
+ALTER TABLE app_user
+    ALTER COLUMN date_joined SET DEFAULT now(),
+    ALTER COLUMN date_joined SET NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_app_user_date_joined_id ON app_user (date_joined DESC, id DESC);
+
+
+-- Admin user search: trigram indexes for ILIKE '%term%'.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS ix_app_user_username_trgm ON app_user USING gin (username gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_profile_firstname_trgm ON profile USING gin (firstname gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_profile_lastname_trgm ON profile USING gin (lastname gin_trgm_ops);
+
+
+-- Admin user search: case-insensitive email match on lower(email).
+DROP INDEX IF EXISTS ix_app_user_email_trgm;
+CREATE INDEX IF NOT EXISTS ix_app_user_email_lower_trgm ON app_user USING gin (lower(email) gin_trgm_ops);
+
+
+-- Cart lookups: a user's latest cart, and a cart's items by variant.
+CREATE INDEX IF NOT EXISTS ix_cart_user_updated ON cart (user_id, updated_at DESC);
+CREATE INDEX IF NOT EXISTS ix_cart_item_cart_variant ON cart_item (cart_id, variant_id);
+DROP INDEX IF EXISTS ix_cart_item_cart_id;
+
+
+-- Media.optimized_versions: JSON -> JSONB with a GIN index.
+ALTER TABLE media ALTER COLUMN optimized_versions TYPE jsonb USING optimized_versions::jsonb;
+ALTER TABLE media ALTER COLUMN optimized_versions SET DEFAULT '{}'::jsonb;
+CREATE INDEX IF NOT EXISTS ix_media_optimized_gin ON media USING gin (optimized_versions jsonb_path_ops);
+
+
+-- Partial indexes for guest carts, new inquiries, published pages and
+-- expiring ledger entries. Each replacement index is built before the index
+-- it supersedes is dropped.
+CREATE UNIQUE INDEX IF NOT EXISTS ix_cart_guest ON cart (guest_token) WHERE guest_token IS NOT NULL;
+DROP INDEX IF EXISTS ix_cart_guest_token;
+CREATE INDEX IF NOT EXISTS ix_b2b_new ON b2b_inquiry (created_at) WHERE status = 'new';
+CREATE INDEX IF NOT EXISTS ix_cms_published ON cms_page (slug) WHERE published;
+CREATE INDEX IF NOT EXISTS ix_loyalty_unexpired ON loyalty_ledger (account_id, expires_at) WHERE expires_at IS NOT NULL;
+DROP INDEX IF EXISTS ix_loyalty_ledger_expires_at;
+
+
+-- Category search: trigram indexes for ILIKE '%term%' on name and slug.
+CREATE INDEX IF NOT EXISTS ix_product_category_name_trgm ON product_category USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_product_category_slug_trgm ON product_category USING gin (slug gin_trgm_ops);
+
+
+-- B2BInquiry.product_categories: JSON-encoded text -> varchar(100)[] with a
+-- GIN index. ALTER ... USING cannot run the json_array_elements_text()
+-- subquery, so the values are copied through a new column instead.
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'b2b_inquiry' AND column_name = 'product_categories') = 'text' THEN
+        ALTER TABLE b2b_inquiry ADD COLUMN product_categories_array varchar(100)[];
+        UPDATE b2b_inquiry
+            SET product_categories_array = ARRAY(
+                SELECT json_array_elements_text(product_categories::json)
+            )::varchar(100)[]
+            WHERE product_categories IS NOT NULL AND product_categories <> '';
+        ALTER TABLE b2b_inquiry DROP COLUMN product_categories;
+        ALTER TABLE b2b_inquiry RENAME COLUMN product_categories_array TO product_categories;
+    END IF;
+END $$;
+CREATE INDEX IF NOT EXISTS ix_b2b_cats_gin ON b2b_inquiry USING gin (product_categories);
+
+
+-- Order items in creation order; the composite index replaces order_id alone.
+CREATE INDEX IF NOT EXISTS ix_order_item_order_id_created_at ON order_item (order_id, created_at);
+DROP INDEX IF EXISTS ix_order_item_order_id;
+
+
+-- Per-user transaction lookups.
+CREATE INDEX IF NOT EXISTS ix_transaction_user_id ON "transaction" (user_id);
+
+
+-- Order.shipping_address, Payment.meta_info and Transaction.meta_info: JSON -> JSONB.
+ALTER TABLE "order" ALTER COLUMN shipping_address TYPE jsonb USING shipping_address::jsonb;
+ALTER TABLE payment ALTER COLUMN meta_info TYPE jsonb USING meta_info::jsonb;
+ALTER TABLE "transaction" ALTER COLUMN meta_info TYPE jsonb USING meta_info::jsonb;
+
+
+-- ProductVariant.attributes: JSON -> JSONB with a GIN index for @> filters.
+ALTER TABLE product_variant ALTER COLUMN attributes TYPE jsonb USING attributes::jsonb;
+ALTER TABLE product_variant ALTER COLUMN attributes SET DEFAULT '{}'::jsonb;
+CREATE INDEX IF NOT EXISTS ix_pv_attrs_gin ON product_variant USING gin (attributes jsonb_path_ops);
+
+
+-- Equality and ordering on variant color and length.
+CREATE INDEX IF NOT EXISTS ix_pv_color ON product_variant ((attributes ->> 'color'));
+CREATE INDEX IF NOT EXISTS ix_pv_length ON product_variant ((attributes ->> 'length'));
+
+
+-- Product full-text search: generated tsvector column and its GIN index.
+ALTER TABLE product ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(sku, '') || ' '
+        || coalesce(description, '') || ' ' || coalesce(slug, ''))
+) STORED;
+CREATE INDEX IF NOT EXISTS ix_product_search ON product USING gin (search_vector);
+
+
+-- Product name and SKU substring search.
+CREATE INDEX IF NOT EXISTS ix_product_name_trgm ON product USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_product_sku_trgm ON product USING gin (sku gin_trgm_ops);
+
+
+-- ProductMaterial.usage_count: count association rows by material.
+CREATE INDEX IF NOT EXISTS ix_product_materials_material_id ON product_materials (material_id);
+CREATE INDEX IF NOT EXISTS ix_variant_materials_material_id ON variant_materials (material_id);
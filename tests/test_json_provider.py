@@ -0,0 +1,42 @@
+import uuid
+from unittest import mock
+
+import orjson
+import pytest
+from flask import Flask
+from quas_utils.api import success_response
+
+from app.json_provider import configure_json
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    configure_json(app)
+    return app
+
+
+def _response(result):
+    # success_response may return (response, status)
+    return result[0] if isinstance(result, tuple) else result
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_success_response_is_encoded_with_orjson(app, debug):
+    app.debug = debug
+    item_id = uuid.uuid4()
+
+    with app.test_request_context(), mock.patch(
+        "app.json_provider.orjson.dumps", wraps=orjson.dumps
+    ) as dumps:
+        response = _response(success_response("ok", 200, {"id": item_id}))
+
+    dumps.assert_called()
+    assert str(item_id) in response.get_data(as_text=True)
+
+
+def test_unknown_keywords_fall_back_to_json(app):
+    with mock.patch("app.json_provider.orjson.dumps") as dumps:
+        assert app.json.dumps({"a": 1}, ensure_ascii=False) == '{"a": 1}'
+
+    dumps.assert_not_called()